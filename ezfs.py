@@ -26,20 +26,30 @@ Includes basic adapters for the following, which can used directly or as example
 from __future__ import annotations
 
 import abc
+import codecs
 import errno
+import functools
 import importlib
+import importlib.util
 import os
-import re
+import pathlib
+import queue
+import stat
+import threading
 import typing
+from contextlib import closing
 from contextlib import contextmanager
 from io import UnsupportedOperation
 from os import PathLike
+from types import MappingProxyType
 from types import ModuleType
 from types import TracebackType
 from typing import Any
 from typing import Callable
 from typing import Generic
 from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
 from typing import TypeVar
 
 try:
@@ -62,11 +72,18 @@ if typing.TYPE_CHECKING:
         class sqlite3:  # pylint: disable=invalid-name
             """Placeholder module for typing."""
 
+            Blob = None
+            Connection = None
             Cursor = None
 
 
 __version__ = "1.1.1"
 __COMPRESSORS__: dict[str, Transform | None] = {}
+# Read-only view of the default compressors, to allow inspection without risk of modifying the shared cache.
+COMPRESSORS = MappingProxyType(__COMPRESSORS__)
+READ_BUFFER_SIZE = 128 * 1024
+_O_RDONLY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
 NO_TRANSFORM = "none"
 NO_COMPRESSION = NO_TRANSFORM
 Path = str | bytes | PathLike[str] | PathLike[bytes]
@@ -141,6 +158,19 @@ class Transform(metaclass=abc.ABCMeta):
         data = self._remove(data)
         return data
 
+    def stream_remove(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Reverse the transformation on previously transformed data, as the data is received in chunks.
+
+        Transformations that cannot be removed incrementally collect all chunks before removal.
+
+        Args:
+            chunks: The bytes with the transformation applied, split into one or more chunks.
+
+        Yields:
+            The original bytes without the transformation, split into one or more chunks.
+        """
+        yield self.remove(b"".join(chunks))
+
 
 class Compressor(Transform):
     """Transform data using a compression/decompression module."""
@@ -150,6 +180,7 @@ class Compressor(Transform):
         compressor: ModuleType,
         compress_kwargs: Any | None = None,
         decompress_kwargs: Any | None = None,
+        stream_decompressor: str | None = None,
     ) -> None:
         """Initialize the compressor with a specific compression module.
 
@@ -157,15 +188,24 @@ class Compressor(Transform):
             compressor: The module, or object, with `compress()` and `decompress()` functions.
             compress_kwargs: Keyword arguments to use during compression. Support varies by compressor.
             decompress_kwargs: Keyword arguments to use during decompression. Support varies by compressor.
+            stream_decompressor: Name of the class in the module used to create incremental decompressors,
+                such as "BZ2Decompressor". Decompressors are created with the decompression keyword arguments.
+                Use None if the module does not support incremental decompression.
         """
         super().__init__(self._compress, self._decompress)
         self.compressor = compressor
         self.compression_kwargs = dict(compress_kwargs or {})
         self.decompression_kwargs = dict(decompress_kwargs or {})
+        self.stream_decompressor = stream_decompressor
 
     @override
     def _copy(self) -> Transform:
-        return type(self)(self.compressor, self.compression_kwargs.copy(), self.decompression_kwargs.copy())
+        return type(self)(
+            self.compressor,
+            self.compression_kwargs.copy(),
+            self.decompression_kwargs.copy(),
+            self.stream_decompressor,
+        )
 
     def _compress(self, data: bytes) -> bytes:
         """Compress the data using the provided module."""
@@ -175,6 +215,148 @@ class Compressor(Transform):
         """Decompress the data using the provided module."""
         return self.compressor.decompress(data, **self.decompression_kwargs)
 
+    @override
+    def stream_remove(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        if self._dependent or not self.stream_decompressor:
+            yield from super().stream_remove(chunks)
+            return
+        decompressor_type = getattr(self.compressor, self.stream_decompressor)
+        yield from _stream_decompress(lambda: decompressor_type(**self.decompression_kwargs), chunks)
+
+
+class _GzipCompressor(Compressor):
+    """Transform data using `gzip`, with single member decompression done directly by `zlib`."""
+
+    @override
+    def _decompress(self, data: bytes) -> bytes:
+        if self.decompression_kwargs or len(data) < 18:
+            return super()._decompress(data)
+        import zlib  # pylint: disable=import-outside-toplevel
+
+        # The trailer stores the size of the content modulo 2**32. Cap the output at that size, and at the maximum deflate
+        # ratio in case the trailer is invalid, then fall back to the module if the member did not end within the cap.
+        trailer_size = int.from_bytes(data[-4:], "little")
+        decompressor = zlib.decompressobj(31)
+        try:
+            content = decompressor.decompress(data, min(trailer_size, len(data) * 1032))
+        except zlib.error:
+            content = None
+        # zlib verifies the CRC and size of the member when the end is reached. Any unused data is another member,
+        # padding, or invalid data. Use the module for those cases, to handle them and raise matching errors.
+        if content is None or not decompressor.eof or decompressor.unused_data:
+            return super()._decompress(data)
+        return content
+
+
+class ZstdCompressor(Compressor):
+    """Transform data using reusable `zstandard` compression contexts, with optional dictionary support.
+
+    Dictionaries trained on samples of similar content greatly improve the compression ratio of small files.
+    """
+
+    def __init__(
+        self,
+        dict_data: bytes | Path | None = None,
+        compress_kwargs: Any | None = None,
+        decompress_kwargs: Any | None = None,
+    ) -> None:
+        """Initialize the compressor with reusable compression and decompression contexts.
+
+        Args:
+            dict_data: Raw bytes of a compression dictionary, or a path to a file containing a compression dictionary.
+                The same dictionary must be used to compress and decompress the data.
+            compress_kwargs: Keyword arguments to use when creating the compression context, such as "level".
+            decompress_kwargs: Keyword arguments to use when creating the decompression context.
+        """
+        if not _module_available("zstandard"):
+            raise ModuleNotFoundError(f"zstandard is required to use {self.__class__.__name__}")
+        super().__init__(_LazyModule("zstandard"), compress_kwargs=compress_kwargs, decompress_kwargs=decompress_kwargs)
+        if dict_data is not None and not isinstance(dict_data, bytes):
+            with open(dict_data, "rb") as file:
+                dict_data = file.read()
+        self.dict_data = dict_data
+        # Contexts are created on first use to defer the module import until compression is actually needed.
+        # Contexts are not safe to use concurrently, each thread creates and reuses its own.
+        self._zstd_dict = None
+        self._contexts = threading.local()
+
+    @override
+    def _copy(self) -> Transform:
+        return type(self)(self.dict_data, self.compression_kwargs.copy(), self.decompression_kwargs.copy())
+
+    def _dictionary(self) -> Any:
+        """Parse the dictionary once, and share it between the contexts, to prevent reloading on every operation."""
+        if self._zstd_dict is None and self.dict_data is not None:
+            self._zstd_dict = self.compressor.ZstdCompressionDict(self.dict_data)
+        return self._zstd_dict
+
+    @override
+    def _compress(self, data: bytes) -> bytes:
+        try:
+            cctx = self._contexts.cctx
+        except AttributeError:
+            cctx = self._contexts.cctx = self.compressor.ZstdCompressor(
+                dict_data=self._dictionary(),
+                **self.compression_kwargs,
+            )
+        return cctx.compress(data)
+
+    def _decompressor(self) -> Any:
+        """Create the decompression context on first use in a thread, and reuse for all later operations."""
+        try:
+            return self._contexts.dctx
+        except AttributeError:
+            dctx = self._contexts.dctx = self.compressor.ZstdDecompressor(
+                dict_data=self._dictionary(),
+                **self.decompression_kwargs,
+            )
+            return dctx
+
+    @override
+    def _decompress(self, data: bytes) -> bytes:
+        return self._decompressor().decompress(data)
+
+    @override
+    def stream_remove(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        if self._dependent:
+            yield from super().stream_remove(chunks)
+            return
+        yield from _stream_decompress(self._decompressor().decompressobj, chunks)
+
+    @staticmethod
+    def train(samples: Iterable[bytes], dict_size: int = 112640) -> bytes:
+        """Train a compression dictionary from samples of file contents.
+
+        Args:
+            samples: Example file contents representative of the data that will be compressed.
+            dict_size: Maximum size of the dictionary in bytes.
+
+        Returns:
+            The raw bytes of the dictionary, which can be saved and reused to create compressors.
+        """
+        import zstandard  # pylint: disable=import-outside-toplevel
+
+        return zstandard.train_dictionary(dict_size, list(samples)).as_bytes()
+
+
+class _LazyModule:
+    """Proxy to a module that is not imported until one of its attributes is first accessed."""
+
+    __slots__ = ("name", "_module")
+
+    def __init__(self, name: str) -> None:
+        """Initialize the proxy with the name of the module to import on first use."""
+        self.name = name
+        self._module = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self.name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self.name}'>"
+
 
 class Filesystem(metaclass=abc.ABCMeta):
     """Collection of file-like objects used for storage and retrival of data."""
@@ -194,8 +376,6 @@ class Filesystem(metaclass=abc.ABCMeta):
             transform: Default transformation used when reading or writing the file contents.
                 Transformations are applied before compression when writing, and after decompression when reading.
         """
-        if not __COMPRESSORS__:
-            init_compressors()
         self.ftype = file_type
         self.compression = compression
         self.transform = transform
@@ -226,7 +406,6 @@ class Filesystem(metaclass=abc.ABCMeta):
             True if the path is a regular file, False otherwise.
         """
 
-    @contextmanager
     def open(
         self,
         file: str,
@@ -246,18 +425,93 @@ class Filesystem(metaclass=abc.ABCMeta):
             transform: Type of transformation used when reading or writing the file contents.
                 Use `None` to default to the Filesystem transformation type.
 
-        Yields:
-            An open file usable as a context manager for read and write operations.
+        Returns:
+            A file usable as a context manager for read and write operations, opened when the context is entered.
         """
-        with self.ftype(
+        # Files are already context managers, return directly instead of wrapping in a generator based context.
+        return self.ftype(
             self,
             file,
             mode=mode,
             encoding=encoding,
             compression=compression or self.compression,
             transform=transform or self.transform,
-        ) as _file:
-            yield _file
+        )
+
+    def _passthrough(self) -> bool:
+        """Whether file contents are stored as is by default, without compression or transformations."""
+        return self.compression in (None, NO_COMPRESSION) and self.transform in (None, NO_TRANSFORM)
+
+    def read_bytes(self, file: str) -> bytes:
+        """Read the binary contents of a file in a single operation.
+
+        Contents use the default compression and transformation of the filesystem. Subclasses may override
+        to read directly from storage, without creating a File, when no compression or transformation is used.
+
+        Args:
+            file: Location of the file in the filesystem.
+
+        Returns:
+            The binary contents of the file.
+
+        Raises:
+            FileNotFoundError if file is not found.
+        """
+        with self.open(file, "rb") as _file:
+            return _file.read()
+
+    def write_bytes(self, file: str, content: bytes) -> int:
+        """Write the binary contents of a file in a single operation.
+
+        Contents use the default compression and transformation of the filesystem. Subclasses may override
+        to write directly to storage, without creating a File, when no compression or transformation is used.
+
+        Args:
+            file: Location of the file in the filesystem.
+            content: The binary contents to write out to the file.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            TypeError if the contents are not bytes.
+        """
+        with self.open(file, "wb") as _file:
+            return _file.write(content)
+
+    def read_many(self, files: Iterable[str], max_workers: int | None = None) -> dict[str, bytes]:
+        """Read the binary contents of multiple files in parallel threads.
+
+        Threads overlap storage latency, and decompression, which releases the GIL in the builtin compression modules.
+        Contents use the default compression and transformation of the filesystem.
+
+        Args:
+            files: Locations of the files in the filesystem.
+            max_workers: Maximum number of threads used to read files. Defaults to the `ThreadPoolExecutor` default.
+
+        Returns:
+            Mapping of file locations to the contents of each file.
+
+        Raises:
+            FileNotFoundError if any file is not found.
+        """
+        files = list(dict.fromkeys(files))
+        return dict(zip(files, _parallel_map(self.read_bytes, files, max_workers)))
+
+    def write_many(self, files: Iterable[tuple[str, bytes]], max_workers: int | None = None) -> int:
+        """Write the binary contents of multiple files in parallel threads.
+
+        Threads overlap storage latency, and compression, which releases the GIL in the builtin compression modules.
+        Contents use the default compression and transformation of the filesystem.
+
+        Args:
+            files: Pairs of file locations and the binary contents to write to each file.
+            max_workers: Maximum number of threads used to write files. Defaults to the `ThreadPoolExecutor` default.
+
+        Returns:
+            Number of bytes written.
+        """
+        return sum(_parallel_map(lambda item: self.write_bytes(*item), files, max_workers))
 
     @abc.abstractmethod
     def _remove(self, path: Path, *, dir_fd: int | None = None) -> None:
@@ -332,6 +586,9 @@ class File(Generic[FilesystemType], metaclass=abc.ABCMeta):
         "encoding",
         "compression",
         "transform",
+        "_readable",
+        "_writable",
+        "_binary",
     )
     valid_modes = ("r", "w", "b", "t", "+")
     skip_write_encode = False
@@ -360,6 +617,8 @@ class File(Generic[FilesystemType], metaclass=abc.ABCMeta):
         self.filesystem = filesystem
         self.file = file
         self.mode = mode
+        # Parse the mode once per open, instead of on every read/write operation.
+        self._readable, self._writable, self._binary = _mode_flags(mode)
         self.encoding = encoding
         self.compression = __COMPRESSORS__[compression] if isinstance(compression, str) else compression
         self.transform = transform if transform != NO_TRANSFORM else None
@@ -400,17 +659,11 @@ class File(Generic[FilesystemType], metaclass=abc.ABCMeta):
 
     def _open_checks(self) -> None:
         """Perform pre-checks before opening a file and raise exceptions matching local files."""
-        mode = self.mode
-        for char in mode:
-            if char not in self.valid_modes:
-                raise ValueError(f"Invalid mode: '{mode}'")
-        if "t" not in mode and "b" not in mode:
-            mode = f"{mode}t"
-            self.mode = mode
-        if "r" in mode and "w" in mode:
-            raise ValueError("must have exactly one of read/write mode")
-        if "t" in mode and "b" in mode:
-            raise ValueError("can't have text and binary mode at once")
+        valid_modes = self.valid_modes
+        if not isinstance(valid_modes, (tuple, frozenset, str)):
+            # Subclasses may define the modes with unhashable types, such as lists or sets, which cannot be cached.
+            valid_modes = frozenset(valid_modes)
+        self.mode = _checked_mode(self.mode, valid_modes)
 
     @abc.abstractmethod
     def _read(self) -> bytes:
@@ -423,18 +676,95 @@ class File(Generic[FilesystemType], metaclass=abc.ABCMeta):
             UnsupportedOperation if the file is not readable.
         """
         self._read_checks()
-        data = self._read()
+        return self._decode(self._read())
+
+    def _decode(self, data: bytes | str) -> bytes | str:
+        """Remove the compression, transformation, and encoding from contents after reading from storage."""
+        # Plain truthiness branches are cheaper than calling bound passthrough functions when no removal is needed.
         if self.compression:
             data = self.compression.remove(data)
         if self.transform:
             data = self.transform.remove(data)
-        if isinstance(data, bytes) and "t" in self.mode:
+        if not self._binary and isinstance(data, bytes):
             data = data.decode(self.encoding)
         return data
 
+    def _iter_raw(self, size: int) -> Iterator[bytes | str]:  # pylint: disable=unused-argument
+        """Read the raw contents of the file in chunks."""
+        # Read the full contents by default. Subclasses must inherit and override if they support partial reads.
+        yield self._read()
+
+    def _readinto(self, buffer: memoryview) -> int:
+        """Read the raw contents of the file directly into a buffer."""
+        # Copy from a full read by default. Subclasses must inherit and override if they support direct reads.
+        data = self._read()
+        size = min(len(data), len(buffer))
+        buffer[:size] = memoryview(data)[:size]
+        return size
+
+    def iter_chunks(self, size: int = READ_BUFFER_SIZE) -> Iterator[bytes | str]:
+        """Read the contents of the file in chunks, to limit memory usage while processing large files.
+
+        Compression is removed incrementally if supported by the compressor. Chunk sizes vary by backend,
+        compression, and transformation, and are not guaranteed to match the requested size.
+
+        Args:
+            size: Preferred number of raw bytes to read from storage per chunk.
+
+        Yields:
+            The contents of the file, split into one or more chunks.
+
+        Raises:
+            UnsupportedOperation if the file is not readable.
+        """
+        self._read_checks()
+        chunks = self._iter_raw(size)
+        if self.compression:
+            chunks = self.compression.stream_remove(chunks)
+        if self.transform:
+            chunks = self.transform.stream_remove(chunks)
+        if self._binary:
+            yield from chunks
+            return
+        decoder = _incremental_decoder(self.encoding)()
+        for chunk in chunks:
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if tail := decoder.decode(b"", final=True):
+            yield tail
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Read the contents of the file into a pre-allocated buffer, such as a bytearray, mmap, or shared memory.
+
+        Without compression or transformations, contents are read directly into the buffer if supported by the backend,
+        to avoid allocating an intermediate copy. Otherwise, contents are removed incrementally into the buffer.
+
+        Args:
+            buffer: Writable buffer to receive the contents. Contents are truncated to the size of the buffer.
+
+        Returns:
+            Number of bytes read into the buffer.
+
+        Raises:
+            UnsupportedOperation if the file is not readable, or not in binary mode.
+        """
+        if not self._binary:
+            raise UnsupportedOperation("readinto() requires binary mode")
+        view = memoryview(buffer).cast("B")
+        if not (self.compression or self.transform):
+            self._read_checks()
+            return self._readinto(view)
+        offset = 0
+        for chunk in self.iter_chunks():
+            size = min(len(chunk), len(view) - offset)
+            view[offset : offset + size] = memoryview(chunk)[:size]
+            offset += size
+            if offset == len(view):
+                break
+        return offset
+
     def _read_checks(self) -> None:
         """Perform pre-checks before reading a file and raise exceptions matching local files."""
-        if "r" not in self.mode:
+        if not self._readable:
             raise UnsupportedOperation("not readable")
 
     @abc.abstractmethod
@@ -455,6 +785,10 @@ class File(Generic[FilesystemType], metaclass=abc.ABCMeta):
             TypeError if the contents are invalid.
         """
         self._write_checks(content)
+        return self._write(self._encode(content))
+
+    def _encode(self, content: bytes | str) -> bytes | str:
+        """Apply the encoding, transformation, and compression to the contents before writing to storage."""
         if (self.compression or self.transform) and isinstance(content, str):
             content = content.encode(self.encoding)
         if self.transform:
@@ -463,18 +797,21 @@ class File(Generic[FilesystemType], metaclass=abc.ABCMeta):
             content = self.compression.apply(content)
         if not self.skip_write_encode and isinstance(content, str):
             content = content.encode(self.encoding)
-        return self._write(content)
+        return content
 
     def _write_checks(self, content: bytes | str) -> None:
         """Perform pre-checks before writing a file and raise exceptions matching local filesystem behavior."""
-        if "w" not in self.mode:
+        if not self._writable:
             raise UnsupportedOperation("not writeable")
-        if not isinstance(content, (bytes, str)):
+        # Check each type once, content must match the text or binary mode of the file.
+        if isinstance(content, bytes):
+            if not self._binary:
+                raise TypeError("write() argument must be str, not bytes")
+        elif isinstance(content, str):
+            if self._binary:
+                raise TypeError("write() argument must be bytes, not str")
+        else:
             raise TypeError("write() argument must be bytes or str")
-        if isinstance(content, bytes) and "b" not in self.mode:
-            raise TypeError("write() argument must be str, not bytes")
-        if isinstance(content, str) and "t" not in self.mode:
-            raise TypeError("write() argument must be bytes, not str")
 
 
 class LocalFilesystem(Filesystem):
@@ -501,7 +838,6 @@ class LocalFilesystem(Filesystem):
         self.safe_paths = safe_paths
 
     @override
-    @contextmanager
     def open(
         self,
         file: str,
@@ -510,21 +846,31 @@ class LocalFilesystem(Filesystem):
         compression: str | Transform | None = None,
         transform: Transform | None = None,
     ) -> LocalFile:
-        path = os.path.abspath(os.path.join(self.directory, file.lstrip(os.path.sep)))
-        if self.safe_paths:
-            # Validate final path to file, and treat as not found if attempting to escape the root.
-            if not path.startswith(self.directory):
-                raise FileNotFoundError(errno.ENOENT, f"No such file or directory: {file}")
-
-        with self.ftype(
+        return self.ftype(
             self,
-            path,
+            self._resolve(file),
             mode=mode,
             encoding=encoding,
             compression=compression or self.compression,
             transform=transform or self.transform,
-        ) as _file:
-            yield _file
+        )
+
+    @override
+    def read_bytes(self, file: str) -> bytes:
+        if not self._passthrough():
+            return super().read_bytes(file)
+        fd = os.open(self._resolve(file), _O_RDONLY)
+        try:
+            return _read_fd(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+    def _resolve(self, file: str) -> str:
+        """Find the full path to a file within the directory of this filesystem."""
+        if self.safe_paths:
+            # Validate final path to file, and treat as not found if attempting to escape the root.
+            return self._validate(file)
+        return os.path.join(self.directory, file.lstrip(os.path.sep))
 
     @override
     def exists(self, path: str | bytes | PathLike[str] | PathLike[bytes]) -> bool:
@@ -561,7 +907,8 @@ class LocalFilesystem(Filesystem):
 
     def _validate(self, path: str) -> str:
         """Ensure a path is within the directory boundary for this filesystem."""
-        final_path = os.path.abspath(os.path.join(self.directory, path.lstrip(os.path.sep)))
+        # Directory is already absolute, so normalizing the join matches abspath() without the extra cwd checks.
+        final_path = os.path.normpath(os.path.join(self.directory, path.lstrip(os.path.sep)))
         if not final_path.startswith(self.directory):
             raise FileNotFoundError(errno.ENOENT, f"No such file or directory: {path}")
         return final_path
@@ -570,7 +917,7 @@ class LocalFilesystem(Filesystem):
 class LocalFile(File[LocalFilesystem]):
     """File-like object on a local filesystem."""
 
-    __slots__ = ("_file",)
+    __slots__ = ("_file", "_fd", "_size")
     skip_write_encode = True
 
     @override
@@ -580,27 +927,60 @@ class LocalFile(File[LocalFilesystem]):
 
     @override
     def _close(self) -> None:
-        self._file.close()
+        if self._file is None:
+            os.close(self._fd)
+        else:
+            self._file.close()
 
     @override
     def _open(self) -> None:
+        # pylint: disable=attribute-defined-outside-init
         # Do not call super full open checks, they will be performed by the native file open operation with local files.
-        mode = self.mode
-        if "t" not in mode and "b" not in mode:
-            mode = f"{mode}t"
+        # Force the mode to binary with compression/transforms to allow native open to read/write the encoded data.
+        mode, buffering, binary = _local_open_args(self.mode, bool(self.compression or self.transform))
+        if mode == "rb":
+            # Binary reads use the file descriptor directly, to skip the syscalls and objects of the native io layers.
+            # The native file is only created if an operation is requested that is not supported by the raw reads.
+            self._file = None
+            self._fd = os.open(self.file, _O_RDONLY)
+            stat_result = os.fstat(self._fd)
+            if stat.S_ISDIR(stat_result.st_mode):
+                os.close(self._fd)
+                raise IsADirectoryError(errno.EISDIR, "Is a directory", self.file)
+            self._size = stat_result.st_size
+            return
+        encoding = None if binary else self.encoding
+        self._file = open(self.file, mode, buffering=buffering, encoding=encoding)  # pylint: disable=consider-using-with
+
+    def _native(self) -> Any:
+        """Find the native file, and create it from the raw file descriptor if only raw reads were used."""
+        if self._file is None:
+            self._file = open(self._fd, "rb", buffering=0)  # pylint: disable=attribute-defined-outside-init,consider-using-with
+        return self._file
 
-        encoding = self.encoding
-        if self.compression or self.transform:
-            # Force the mode to binary to allow utilizing native open operation to read/write compressed data.
-            mode = mode.replace("t", "b")
-            encoding = None
-        if "b" in mode:
-            encoding = None
-        self._file = open(self.file, mode, encoding=encoding)  # pylint: disable=attribute-defined-outside-init,consider-using-with
+    @override
+    def _iter_raw(self, size: int) -> Iterator[bytes | str]:
+        if self._file is None:
+            while chunk := os.read(self._fd, size):
+                yield chunk
+            return
+        while chunk := self._file.read(size):
+            yield chunk
+
+    @override
+    def _readinto(self, buffer: memoryview) -> int:
+        native = self._native()
+        offset = 0
+        # A single raw read may return less than requested, such as reads over ~2 GiB on Linux, so repeat until full.
+        while offset < len(buffer) and (size := native.readinto(buffer[offset:])):
+            offset += size
+        return offset
 
     @override
     def _read(self) -> bytes | str:
-        return self._file.read()
+        if self._file is not None:
+            return self._file.read()
+        return _read_fd(self._fd, self._size)
 
     @override
     def _read_checks(self) -> None:
@@ -609,7 +989,7 @@ class LocalFile(File[LocalFilesystem]):
 
     @override
     def _write(self, data: bytes | str) -> int:
-        return self._file.write(data)
+        return self._native().write(data)
 
     @override
     def _write_checks(self, content: bytes | str) -> None:
@@ -636,17 +1016,51 @@ class MemFilesystem(Filesystem):
         super().__init__(MemFile, compression=compression, transform=transform)
         self.tree = tree or {}
 
+    @override
+    def read_many(self, files: Iterable[str], max_workers: int | None = None) -> dict[str, bytes]:
+        if not self._passthrough():
+            return super().read_many(files, max_workers=max_workers)
+        # Reading directly from memory is faster than the overhead of sharing the work across threads.
+        return {file: self.read_bytes(file) for file in files}
+
+    @override
+    def write_many(self, files: Iterable[tuple[str, bytes]], max_workers: int | None = None) -> int:
+        if not self._passthrough():
+            return super().write_many(files, max_workers=max_workers)
+        # Merge the contents into the tree in a single update, instead of individual writes.
+        files = list(files)
+        for _, content in files:
+            if not isinstance(content, bytes):
+                raise TypeError("write() argument must be bytes, not str")
+        self.tree.update(files)
+        return sum(len(content) for _, content in files)
+
     @override
     def isfile(self, path: str | bytes | PathLike[str] | PathLike[bytes]) -> bool:
-        return str(path) in self.tree
+        return _as_str(path) in self.tree
+
+    @override
+    def read_bytes(self, file: str) -> bytes:
+        content = self.tree.get(file)
+        if not self._passthrough() or not isinstance(content, bytes):
+            # Use the full File to remove compression/transforms, and raise matching errors for missing files.
+            return super().read_bytes(file)
+        return content
+
+    @override
+    def write_bytes(self, file: str, content: bytes) -> int:
+        if not self._passthrough() or not isinstance(content, bytes):
+            return super().write_bytes(file, content)
+        self.tree[file] = content
+        return len(content)
 
     @override
     def _remove(self, path: str | bytes | PathLike[str] | PathLike[bytes], *, dir_fd: int | None = None) -> None:
-        self.tree.pop(str(path))
+        self.tree.pop(_as_str(path))
 
     @override
     def _rename(self, src: Path, dst: Path, *, src_dir_fd: int | None = None, dst_dir_fd: int | None = None) -> None:
-        self.tree[str(dst)] = self.tree.pop(str(src))
+        self.tree[_as_str(dst)] = self.tree.pop(_as_str(src))
 
 
 class MemFile(File[MemFilesystem]):
@@ -660,7 +1074,7 @@ class MemFile(File[MemFilesystem]):
 
     @override
     def _read_checks(self) -> None:
-        if "r" in self.mode and self.file not in self.filesystem.tree:
+        if self._readable and self.file not in self.filesystem.tree:
             raise FileNotFoundError(errno.ENOENT, f"No such file: '{self.file}'")
         super()._read_checks()
 
@@ -682,6 +1096,7 @@ class S3BotoFilesystem(Filesystem):
         profile_name: str = None,
         compression: str | Transform | None = NO_COMPRESSION,
         transform: Transform | None = None,
+        transfer_config: Any = None,
     ) -> None:
         """Initialize the base attributes of the S3 filesystem for read and write operations.
 
@@ -693,11 +1108,15 @@ class S3BotoFilesystem(Filesystem):
             profile_name: Name of a custom profile to use, instead of default.
             compression: Default compression type to use when reading or writing file contents.
             transform: Default transformation used when reading or writing file contents.
+            transfer_config: `boto3.s3.transfer.TransferConfig` used to read objects larger than the multipart
+                threshold with concurrent ranged requests, split by the multipart chunk size, and limited by the
+                max concurrency. Defaults to the boto3 defaults.
         """
         super().__init__(S3BotoFile, compression=compression, transform=transform)
         try:
             # pylint: disable=import-outside-toplevel,invalid-name
             import boto3
+            from boto3.s3.transfer import TransferConfig
             from botocore.exceptions import ClientError
 
             self.ClientError = ClientError
@@ -712,12 +1131,13 @@ class S3BotoFilesystem(Filesystem):
             profile_name=profile_name,
         )
         self.client = self._session.client("s3")
+        self.transfer_config = transfer_config or TransferConfig()
 
     @override
     def isfile(self, path: str | bytes | PathLike[str] | PathLike[bytes]) -> bool:
         isfile = True
         try:
-            self.client.head_object(Bucket=self.bucket_name, Key=str(path))
+            self.client.head_object(Bucket=self.bucket_name, Key=_as_str(path))
         except self.ClientError as client_error:
             if not client_error.response["Error"]["Code"] == "404":
                 raise
@@ -726,12 +1146,12 @@ class S3BotoFilesystem(Filesystem):
 
     @override
     def _remove(self, path: str | bytes | PathLike[str] | PathLike[bytes], *, dir_fd: int | None = None) -> None:
-        self.client.delete_object(Bucket=self.bucket_name, Key=str(path))
+        self.client.delete_object(Bucket=self.bucket_name, Key=_as_str(path))
 
     @override
     def _rename(self, src: Path, dst: Path, *, src_dir_fd: int | None = None, dst_dir_fd: int | None = None) -> None:
-        cp_src = {"Bucket": self.bucket_name, "Key": src}
-        self.client.copy_object(Bucket=self.bucket_name, Key=str(dst), CopySource=cp_src)
+        cp_src = {"Bucket": self.bucket_name, "Key": _as_str(src)}
+        self.client.copy_object(Bucket=self.bucket_name, Key=_as_str(dst), CopySource=cp_src)
         self._remove(src)
 
 
@@ -744,17 +1164,51 @@ class S3BotoFile(File[S3BotoFilesystem]):
     def __repr__(self) -> str:
         return f"{self.filesystem.bucket_name}:{self.file}"
 
-    @override
-    def _read(self) -> bytes:
+    def _get_object(self) -> dict:
+        """Request the object from the bucket, and return the response with the streaming body."""
         try:
-            read_response = self.filesystem.client.get_object(Bucket=self.filesystem.bucket_name, Key=self.file)
-            content = read_response["Body"].read()
+            return self.filesystem.client.get_object(Bucket=self.filesystem.bucket_name, Key=self.file)
         except self.filesystem.ClientError as client_error:
             # For consistency across File types, change missing objects errors to standard FileNotFoundErrors.
             if client_error.response["Error"]["Code"] == "NoSuchKey":
                 raise FileNotFoundError(errno.ENOENT, f"No such file: {self}") from client_error
             raise client_error
-        return content
+
+    @override
+    def _iter_raw(self, size: int) -> Iterator[bytes]:
+        yield from self._get_object()["Body"].iter_chunks(size)
+
+    def _get_range(self, byte_range: tuple[int, int], etag: str) -> bytes:
+        """Request a range of bytes from the object, only if the object still matches the original version."""
+        start, end = byte_range
+        response = self.filesystem.client.get_object(
+            Bucket=self.filesystem.bucket_name,
+            Key=self.file,
+            Range=f"bytes={start}-{end}",
+            IfMatch=etag,
+        )
+        return response["Body"].read()
+
+    @override
+    def _read(self) -> bytes:
+        read_response = self._get_object()
+        size = read_response["ContentLength"]
+        config = self.filesystem.transfer_config
+        if size < config.multipart_threshold:
+            return read_response["Body"].read()
+
+        # Large objects are faster to read with concurrent ranged requests than a single stream.
+        # Keep the first part from the open stream, and only request the remaining parts, from the same object version.
+        part_size = config.multipart_chunksize
+        with closing(read_response["Body"]) as body:
+            first_part = body.read(part_size)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(len(first_part), size, part_size)]
+        parts = _parallel_map(
+            functools.partial(self._get_range, etag=read_response["ETag"]),
+            ranges,
+            config.max_request_concurrency,
+        )
+        return b"".join([first_part, *parts])
 
     @override
     def _write(self, data: bytes) -> int:
@@ -762,7 +1216,55 @@ class S3BotoFile(File[S3BotoFilesystem]):
         return len(data)
 
 
-class SQLiteFilesystem(Filesystem):
+class _APSWConnection:
+    """Adapter to provide the `sqlite3.Connection` operations used by SQLiteFilesystem with an `apsw.Connection`.
+
+    apsw does not implicitly open transactions, every statement is committed automatically unless a transaction
+    is explicitly started with "BEGIN".
+    """
+
+    def __init__(self, connection: Any) -> None:
+        """Initialize the adapter with an open apsw connection."""
+        self.connection = connection
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is currently open."""
+        return self.connection.in_transaction
+
+    def blobopen(self, table: str, column: str, row: int, *, readonly: bool = True) -> Any:
+        """Open a BLOB for incremental I/O."""
+        return self.connection.blobopen("main", table, column, row, not readonly)
+
+    def commit(self) -> None:
+        """Commit the open transaction, if any."""
+        if self.connection.in_transaction:
+            self.connection.execute("COMMIT")
+
+    def execute(self, sql: str, params: Iterable | dict = ()) -> Any:
+        """Execute a SQL statement using a new cursor."""
+        return self.connection.execute(sql, params)
+
+    def rollback(self) -> None:
+        """Roll back the open transaction, if any."""
+        if self.connection.in_transaction:
+            self.connection.execute("ROLLBACK")
+
+
+class _SQLiteQueries(NamedTuple):
+    """Query strings used to manage files in a SQLite table."""
+
+    create: str
+    read: str
+    read_many: str
+    write: str
+    exists: str
+    rowid: str
+    remove: str
+    rename: str
+
+
+class SQLiteFilesystem(Filesystem):  # pylint: disable=too-many-instance-attributes
     """Collection of file-like objects available in a database using SQLite."""
 
     def __init__(  # pylint: disable=too-many-arguments
@@ -773,6 +1275,10 @@ class SQLiteFilesystem(Filesystem):
         content_col: str = "content",
         compression: str | Transform | None = NO_COMPRESSION,
         transform: Transform | None = None,
+        read_pool_size: int = 0,
+        driver: str = "sqlite3",
+        without_rowid: bool = True,
+        journal_mode: str | None = None,
     ) -> None:
         """Initialize the base attributes of the database filesystem for read and write operations.
 
@@ -783,56 +1289,280 @@ class SQLiteFilesystem(Filesystem):
             content_col: Name of the column in the table that contains the raw contents for the files.
             compression: Default compression type to use when reading or writing file contents.
             transform: Default transformation used when reading or writing file contents.
+            read_pool_size: Number of read-only connections to share across threads for read operations.
+                Use 0 to perform all operations on the primary connection. Ignored for in-memory databases.
+            driver: Name of the module used to connect to the database: "sqlite3" or "apsw".
+                "apsw" reuses prepared statements across operations, and falls back to "sqlite3" if not installed.
+            without_rowid: Whether tables are created without rowids, to look up files with a single index search.
+                Disable for tables that primarily store large files, or to allow incremental I/O via `blobopen()`.
+            journal_mode: Journal mode set on file databases when connecting: "DELETE", "TRUNCATE", "PERSIST",
+                "MEMORY", "WAL", or "OFF". Defaults to None, to keep the existing mode of the database.
+                "WAL" (write-ahead logging) allows readers to run concurrently with a writer, and only syncs to disk
+                at checkpoints. WAL mode is persistent: the database file stays in WAL mode for all later connections,
+                and "-wal" and "-shm" files are created next to it while connected.
+
+        Raises:
+            ValueError if the journal mode is not valid.
         """
-        for name, value in (
-            ("table_name", table_name),
-            ("file_col", file_col),
-            ("content_col", content_col),
-        ):
-            if not re.match(r"^[A-za-z0-9_]+$", value):
-                raise ValueError(f"{name} may only contain letters, numbers, and underscores.")
+        if journal_mode is not None and journal_mode.upper() not in _JOURNAL_MODES:
+            raise ValueError(f"Invalid journal mode: {journal_mode}. Valid modes: {', '.join(_JOURNAL_MODES)}")
         super().__init__(SQLiteFile, compression=compression, transform=transform)
 
         # Save the database and table name to allow string representations in files,
         # but cache the templates to prevent modifications from impacting later execution.
         self.database = database
         self.table_name = table_name
+        self._content_col = content_col
+        self.driver = driver
         self._connection = None
-        self._cursor = None
         self._connect()
+        if journal_mode and self.database not in ("", ":memory:"):
+            # Page size must be set before the journal mode, it cannot be changed after a database is in WAL mode.
+            # Larger pages reduce overflow pages for file contents. Only applies to new databases, ignored otherwise.
+            self.execute("PRAGMA page_size=32768")
+            mode = self.execute(f"PRAGMA journal_mode={journal_mode}").fetchone()[0]
+            if mode.lower() == "wal":
+                # Syncing only at checkpoints is safe from corruption in WAL mode, and avoids a sync on every commit.
+                # Other modes keep the default full syncs, they can be corrupted by power loss with fewer syncs.
+                self.execute("PRAGMA synchronous=NORMAL")
+        self._readers = None
+        # Batches are tracked per thread, so only the thread that opened a batch reads from the primary connection.
+        self._batches = threading.local()
+        if read_pool_size > 0 and self.database not in ("", ":memory:"):
+            self._readers = queue.Queue()
+            for _ in range(read_pool_size):
+                self._readers.put(self._connect_reader())
 
         # Cache the query strings to reduce overhead.
-        # "nosec" added due to validation before this point.
-        self._create_query = f"CREATE TABLE {table_name}({file_col} TEXT(255) PRIMARY KEY, {content_col} BLOB)"  # nosec
-        self.read_query = f"SELECT {content_col} FROM {table_name} WHERE {file_col} = (?) LIMIT 1"  # nosec
-        self.write_query = (
-            f"INSERT INTO {table_name}({file_col}, {content_col}) VALUES(?, ?) "  # nosec
-            f"ON CONFLICT({file_col}) DO UPDATE SET {content_col}=?;"
-        )
-        self.exists_query = f"SELECT {file_col} FROM {table_name} WHERE {file_col}=(?) LIMIT 1;"  # nosec
-        self.remove_query = f"DELETE FROM {table_name} WHERE {file_col}=(?);"  # nosec
-        self.rename_query = f"UPDATE {table_name} SET {file_col}=(?) WHERE {file_col}=(?);"  # nosec
+        queries = _sqlite_queries(table_name, file_col, content_col, without_rowid)
+        self._create_query = queries.create
+        self.read_query = queries.read
+        self.read_many_query = queries.read_many
+        self.write_query = queries.write
+        self.exists_query = queries.exists
+        self.rowid_query = queries.rowid
+        self.remove_query = queries.remove
+        self.rename_query = queries.rename
 
         if self.database == ":memory:":
             self.create_table()
 
+    def blobopen(self, path: Path, *, readonly: bool = True) -> sqlite3.Blob:
+        """Open the raw content of a file for incremental I/O, without loading the entire content into memory.
+
+        Content is returned as stored, without removing compression or transformations, to allow streaming
+        large files into a caller managed decompressor or buffer. Requires Python 3.11+, and a table with rowids.
+
+        Args:
+            path: Location of the file in the filesystem.
+            readonly: Whether the content should be opened without write permissions.
+
+        Returns:
+            A file-like object with access to the raw stored content.
+
+        Raises:
+            FileNotFoundError if path is not found.
+            NotImplementedError if incremental I/O is not supported by the Python version, or the table has no rowids.
+        """
+        if not hasattr(self._connection, "blobopen"):
+            raise NotImplementedError(f"blobopen is not supported by {self.__class__.__name__} before Python 3.11")
+        if self._without_rowid():
+            raise NotImplementedError(f"blobopen is not supported by tables created WITHOUT ROWID: {self.table_name}")
+        res = self.fetchone(self.rowid_query, (_as_str(path),))
+        if res is None:
+            raise FileNotFoundError(errno.ENOENT, f"No such file: '{path}'")
+        return self._connection.blobopen(self.table_name, self._content_col, res[0], readonly=readonly)
+
+    def _without_rowid(self) -> bool:
+        """Check whether the table was created without rowids, which prevents incremental I/O."""
+        res = self.fetchone("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (self.table_name,))
+        return res is not None and "WITHOUT ROWID" in " ".join(res[0].upper().split())
+
+    @property
+    def _batch_depth(self) -> int:
+        """Number of nested batches open in the current thread."""
+        return getattr(self._batches, "depth", 0)
+
+    def _autocommit(self) -> None:
+        """Commit pending transactions after a modification, unless the modification is part of a batch."""
+        if not self._batch_depth:
+            self._connection.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[SQLiteFilesystem]:
+        """Group modifications, such as writes, removals, and renames, into a single transaction.
+
+        Pending modifications are committed once when the outermost batch exits, instead of after every operation,
+        to reduce the number of disk syncs. Modifications are rolled back if the batch raises an exception.
+        Nested batches only roll back their own modifications, and the outer batch can continue if the error is handled.
+        Modifications are visible to this filesystem immediately, but not to other connections until committed.
+
+        Yields:
+            This filesystem, to perform the batched modifications.
+        """
+        depth = self._batch_depth
+        savepoint = f"ezfs_batch_{depth}"
+        if depth:
+            # Nested batches use savepoints, to only roll back their own modifications if they raise.
+            self._connection.execute(f"SAVEPOINT {savepoint}")
+        elif not self._connection.in_transaction:
+            # Acquire the write lock immediately, to fail fast instead of when upgrading from a read lock.
+            self._connection.execute("BEGIN IMMEDIATE")
+        self._batches.depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            self._batches.depth = depth
+            if depth:
+                self._connection.execute(f"ROLLBACK TO {savepoint}")
+                self._connection.execute(f"RELEASE {savepoint}")
+            else:
+                self._connection.rollback()
+            raise
+        self._batches.depth = depth
+        if depth:
+            self._connection.execute(f"RELEASE {savepoint}")
+        else:
+            self._autocommit()
+
     def commit(self) -> None:
         """Commit any pending transactions to the database backend."""
         self._connection.commit()
 
+    @override
+    def write_many(
+        self,
+        files: Iterable[tuple[str, bytes]],
+        max_workers: int | None = None,
+        chunk_size: int = 100,
+    ) -> int:
+        """Write the binary contents of multiple files in a single transaction.
+
+        Files are inserted in groups of multiple rows per statement, to reduce the overhead of individual writes.
+        Contents use the default compression and transformation of the filesystem.
+        Compression and transformations are applied in parallel threads before any contents are inserted.
+
+        Args:
+            files: Pairs of file locations and the binary contents to write to each file.
+            max_workers: Maximum number of threads used to apply compression and transformations.
+                Defaults to the `ThreadPoolExecutor` default.
+            chunk_size: Maximum number of files to insert per statement. Must be less than 500 to stay below
+                the default SQLite limit of 999 parameters per statement.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            TypeError if any content is not bytes.
+        """
+        rows = list(files)
+        for _, content in rows:
+            if not isinstance(content, bytes):
+                raise TypeError(f"write() argument must be bytes, not {type(content).__name__}")
+        if not self._passthrough():
+            handle = self.ftype(self, "", mode="wb", compression=self.compression, transform=self.transform)
+            encoded = _parallel_map(handle._encode, [content for _, content in rows], max_workers)  # pylint: disable=protected-access
+            rows = [(file, data) for (file, _), data in zip(rows, encoded)]
+        written = sum(len(data) for _, data in rows)
+        with self.batch():
+            for index in range(0, len(rows), chunk_size):
+                chunk = rows[index : index + chunk_size]
+                params = [param for row in chunk for param in row]
+                self.execute(_expand_values(self.write_query, len(chunk)), params)
+        return written
+
+    @override
+    def read_many(
+        self,
+        files: Iterable[str],
+        max_workers: int | None = None,
+        chunk_size: int = 500,
+    ) -> dict[str, bytes]:
+        """Read the binary contents of multiple files with one query per chunk of files.
+
+        Contents use the default compression and transformation of the filesystem.
+        Compression and transformations are removed in parallel threads after all contents are selected.
+
+        Args:
+            files: Locations of the files in the filesystem.
+            max_workers: Maximum number of threads used to remove compression and transformations.
+                Defaults to the `ThreadPoolExecutor` default.
+            chunk_size: Maximum number of files to select per statement. Must be less than 1000 to stay below
+                the default SQLite limit of 999 parameters per statement.
+
+        Returns:
+            Mapping of file locations to the contents of each file.
+
+        Raises:
+            FileNotFoundError if any path is not found.
+        """
+        files = list(dict.fromkeys(files))
+        rows = {}
+        with self._reader() as connection:
+            for index in range(0, len(files), chunk_size):
+                chunk = files[index : index + chunk_size]
+                rows.update(connection.execute(_expand_in(self.read_many_query, len(chunk)), chunk))
+        # Rows are returned in database order, rebuild the mapping in the requested order.
+        contents = {}
+        for file in files:
+            if file not in rows:
+                raise FileNotFoundError(errno.ENOENT, f"No such file: '{file}'")
+            contents[file] = rows[file]
+        if not self._passthrough():
+            handle = self.ftype(self, "", mode="rb", compression=self.compression, transform=self.transform)
+            contents = dict(zip(contents, _parallel_map(handle._decode, contents.values(), max_workers)))  # pylint: disable=protected-access
+        return contents
+
     def _connect(self) -> None:
-        """Establish a connection to the database, and request a cursor."""
+        """Establish a connection to the database."""
+        if self.driver == "apsw":
+            try:
+                import apsw  # pylint: disable=import-outside-toplevel
+
+                self._connection = _APSWConnection(apsw.Connection(self.database))
+                return
+            except ModuleNotFoundError:
+                # Optional driver is not installed, fall back to the builtin driver.
+                self.driver = "sqlite3"
         try:
             # pylint: disable=import-outside-toplevel,redefined-outer-name,reimported
             import sqlite3
 
         except ModuleNotFoundError as error:
             raise ModuleNotFoundError(f"sqlite3 is required to use {self.__class__.__name__}") from error
-        self._connection = sqlite3.connect(self.database)
-        self._cursor = self._connection.cursor()
+        # Autocommit single statements, to skip the implicit BEGIN/COMMIT pair around every write.
+        # Transactions are explicitly managed by batches to group multiple modifications.
+        self._connection = sqlite3.connect(self.database, isolation_level=None, cached_statements=256)
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        """Establish a read-only connection to the database that can be shared across threads."""
+        if self.driver == "apsw":
+            import apsw  # pylint: disable=import-outside-toplevel
+
+            return _APSWConnection(apsw.Connection(self.database, flags=apsw.SQLITE_OPEN_READONLY))
+        import sqlite3  # pylint: disable=import-outside-toplevel,redefined-outer-name,reimported
+
+        # Readers are handed out to a single thread at a time by the pool, so the same thread check can be skipped.
+        uri = f"{pathlib.Path(self.database).absolute().as_uri()}?mode=ro"
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool, or the primary connection if pooling is disabled."""
+        if self._readers is None or self._batch_depth:
+            # Pending modifications in a batch are only visible to the primary connection.
+            yield self._connection
+            return
+        connection = self._readers.get()
+        try:
+            yield connection
+        finally:
+            self._readers.put(connection)
 
     def create_table(self) -> None:
         """Create a basic table to use for storage."""
+        # Larger pages reduce overflow pages for file contents. Only applies to new databases, ignored otherwise.
+        self.execute("PRAGMA page_size=32768")
         self.execute(self._create_query)
 
     def execute(self, sql: str, params: Iterable | dict = ()) -> sqlite3.Cursor:
@@ -845,25 +1575,54 @@ class SQLiteFilesystem(Filesystem):
         Returns:
             The cursor used to execute the statement, allowing caller to fetch results.
         """
-        return self._cursor.execute(sql, params)
+        # Use a new cursor per statement to prevent sharing state, such as fetch results, between callers.
+        return self._connection.execute(sql, params)
+
+    def fetchone(self, sql: str, params: Iterable | dict = ()) -> Any:
+        """Execute a read-only SQL statement against the backend storage table, and fetch the first result.
+
+        Uses a pooled read-only connection if available, to allow concurrent reads across threads.
+
+        Args:
+            sql: A single SQL statement.
+            params: Iterable of values to bind to placeholders in sql, or dict if named placeholders are used.
+
+        Returns:
+            The first row of the results, or None if no rows were found.
+        """
+        with self._reader() as connection:
+            return connection.execute(sql, params).fetchone()
 
     @override
     def isfile(self, path: str | bytes | PathLike[str] | PathLike[bytes]) -> bool:
-        isfile = True
-        res = self.execute(self.exists_query, (str(path),)).fetchone()
+        return self.fetchone(self.exists_query, (_as_str(path),)) is not None
+
+    @override
+    def read_bytes(self, file: str) -> bytes:
+        if not self._passthrough():
+            return super().read_bytes(file)
+        res = self.fetchone(self.read_query, (file,))
         if res is None:
-            isfile = False
-        return isfile
+            raise FileNotFoundError(errno.ENOENT, f"No such file: '{file}'")
+        return res[0]
+
+    @override
+    def write_bytes(self, file: str, content: bytes) -> int:
+        if not self._passthrough() or not isinstance(content, bytes):
+            return super().write_bytes(file, content)
+        self.execute(self.write_query, (file, content))
+        self._autocommit()
+        return len(content)
 
     @override
     def _remove(self, path: str | bytes | PathLike[str] | PathLike[bytes], *, dir_fd: int | None = None) -> None:
-        self.execute(self.remove_query, (str(path),))
-        self.commit()
+        self.execute(self.remove_query, (_as_str(path),))
+        self._autocommit()
 
     @override
     def _rename(self, src: Path, dst: Path, *, src_dir_fd: int | None = None, dst_dir_fd: int | None = None) -> None:
-        self.execute(self.rename_query, (str(dst), str(src)))
-        self.commit()
+        self.execute(self.rename_query, (_as_str(dst), _as_str(src)))
+        self._autocommit()
 
 
 class SQLiteFile(File[SQLiteFilesystem]):
@@ -877,7 +1636,7 @@ class SQLiteFile(File[SQLiteFilesystem]):
 
     @override
     def _read(self) -> bytes:
-        res = self.filesystem.execute(self.filesystem.read_query, (self.file,)).fetchone()
+        res = self.filesystem.fetchone(self.filesystem.read_query, (self.file,))
         if res is None:
             raise FileNotFoundError(errno.ENOENT, f"No such file: '{self.file}'")
         content = res[0]
@@ -885,38 +1644,200 @@ class SQLiteFile(File[SQLiteFilesystem]):
 
     @override
     def _write(self, data: bytes) -> int:
-        self.filesystem.execute(self.filesystem.write_query, (self.file, data, data))
-        self.filesystem.commit()
+        # Bind the content once, and reuse it on conflict, to prevent SQLite from copying the BLOB twice per write.
+        self.filesystem.execute(self.filesystem.write_query, (self.file, data))
+        self.filesystem._autocommit()  # pylint: disable=protected-access
         return len(data)
 
 
-def init_compressors() -> list[str]:
+def _parallel_map(func: Callable, items: Iterable, max_workers: int | None = None) -> list:
+    """Run a function against every item in parallel threads, and collect the results in the original order."""
+    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _stream_decompress(create_decompressor: Callable[[], Any], chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress chunks with incremental decompressors, and raise if the content ends before the compressed stream.
+
+    Content may contain multiple concatenated streams. Incremental decompressors stop at the end of the first stream,
+    so a new decompressor is created for the data after the end of each stream.
+    """
+    decompressor = create_decompressor()
+    received = False
+    for chunk in chunks:
+        while chunk:
+            received = True
+            if getattr(decompressor, "eof", False):
+                decompressor = create_decompressor()
+            yield decompressor.decompress(chunk)
+            chunk = decompressor.unused_data if getattr(decompressor, "eof", False) else b""
+    # Incremental decompressors return partial content on truncated data, instead of raising like full decompression.
+    if received and not getattr(decompressor, "eof", True):
+        raise EOFError("Compressed data ended before the end-of-stream marker was reached")
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read the remaining contents of a raw file descriptor, using the expected size to read in as few calls as possible."""
+    chunks = []
+    remaining = size
+    # Request one byte past the remaining size to detect files that grew, or report no size, such as special files.
+    # A single read may return less than requested, such as reads over ~2 GiB on Linux, so repeat until size is reached.
+    while chunk := os.read(fd, remaining + 1):
+        chunks.append(chunk)
+        remaining -= len(chunk)
+        if remaining < 0:
+            while chunk := os.read(fd, READ_BUFFER_SIZE):
+                chunks.append(chunk)
+            break
+        if not remaining and len(chunks) == 1:
+            # A full read in a single call already included the extra byte used to detect growth.
+            break
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _as_str(path: Path) -> str:
+    """Convert a path to a string, with a fast path for paths that are already strings."""
+    # Identity type check is faster than isinstance(), and covers the most common usage.
+    if type(path) is str:  # pylint: disable=unidiomatic-typecheck
+        return path
+    return os.fsdecode(path) if isinstance(path, (bytes, PathLike)) else str(path)
+
+
+@functools.lru_cache(maxsize=16)
+def _incremental_decoder(encoding: str) -> type[codecs.IncrementalDecoder]:
+    """Find the incremental decoder type for an encoding, and cache to skip the codec registry lookup on every read."""
+    return codecs.getincrementaldecoder(encoding)
+
+
+@functools.lru_cache(maxsize=32)
+def _checked_mode(mode: str, valid_modes: Iterable[str]) -> str:
+    """Validate a mode, and add the implicit text option, and cache to skip the checks on every open."""
+    if not frozenset(mode).issubset(valid_modes):
+        raise ValueError(f"Invalid mode: '{mode}'")
+    if "t" not in mode and "b" not in mode:
+        mode = f"{mode}t"
+    if "r" in mode and "w" in mode:
+        raise ValueError("must have exactly one of read/write mode")
+    if "t" in mode and "b" in mode:
+        raise ValueError("can't have text and binary mode at once")
+    return mode
+
+
+@functools.lru_cache(maxsize=32)
+def _mode_flags(mode: str) -> tuple[bool, bool, bool]:
+    """Parse whether a mode is readable, writable, and binary, and cache to share across opens."""
+    return "r" in mode, "w" in mode, "b" in mode
+
+
+@functools.lru_cache(maxsize=32)
+def _local_open_args(mode: str, force_binary: bool) -> tuple[str, int, bool]:
+    """Canonicalize a mode into the native open mode, buffer size, and binary flag, and cache to share across opens."""
+    if "t" not in mode and "b" not in mode:
+        mode = f"{mode}t"
+    if force_binary:
+        mode = mode.replace("t", "b")
+    binary = "b" in mode
+    buffering = READ_BUFFER_SIZE
+    if binary and "r" in mode:
+        # Binary reads request large blocks, or the full file sized from a stat, so skip the buffer layer.
+        buffering = 0
+    return mode, buffering, binary
+
+
+@functools.lru_cache(maxsize=128)
+def _sqlite_queries(table_name: str, file_col: str, content_col: str, without_rowid: bool = True) -> _SQLiteQueries:
+    """Build the query strings for a SQLite table layout, and cache to share across filesystems with the same layout."""
+    table_name, file_col, content_col = (
+        _quote_identifier(table_name),
+        _quote_identifier(file_col),
+        _quote_identifier(content_col),
+    )
+    # "nosec" added due to quoting of all names before this point.
+    return _SQLiteQueries(
+        create=(
+            f"CREATE TABLE {table_name}({file_col} TEXT PRIMARY KEY, {content_col} BLOB)"  # nosec
+            f"{' WITHOUT ROWID' if without_rowid else ''}"
+        ),
+        read=f"SELECT {content_col} FROM {table_name} WHERE {file_col}=? LIMIT 1",  # nosec
+        read_many=f"SELECT {file_col}, {content_col} FROM {table_name} WHERE {file_col} IN (?)",  # nosec
+        write=(
+            f"INSERT INTO {table_name}({file_col}, {content_col}) VALUES(?, ?) "  # nosec
+            f"ON CONFLICT({file_col}) DO UPDATE SET {content_col}=excluded.{content_col};"
+        ),
+        exists=f"SELECT 1 FROM {table_name} WHERE {file_col}=? LIMIT 1;",  # nosec
+        rowid=f"SELECT rowid FROM {table_name} WHERE {file_col}=? LIMIT 1;",  # nosec
+        remove=f"DELETE FROM {table_name} WHERE {file_col}=?;",  # nosec
+        rename=f"UPDATE {table_name} SET {file_col}=? WHERE {file_col}=?;",  # nosec
+    )
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a SQL identifier, such as a table or column name, to allow safe use of any characters in the name."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_values(query: str, rows: int) -> str:
+    """Expand a single row insert query into a query that inserts multiple rows at once."""
+    return query.replace("VALUES(?, ?)", f"VALUES{', '.join(['(?, ?)'] * rows)}", 1)
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_in(query: str, values: int) -> str:
+    """Expand a single value IN query into a query that matches multiple values at once."""
+    return query.replace("IN (?)", f"IN ({', '.join(['?'] * values)})", 1)
+
+
+def init_compressors(levels: dict[str, int] | None = None) -> list[str]:
     """Search the system for available compression algorithms.
 
+    Args:
+        levels: Compression level to use by default for each compression type, such as {"gzip": 1}.
+            Lower levels trade compression ratio for speed. Use None to keep the defaults of each module.
+
     Returns:
         List of the available compression types for reading and writing files.
     """
+    levels = levels or {}
     __COMPRESSORS__.update({None: None, NO_COMPRESSION: None})
     libs = (
         # Builtin compression modules.
-        ("bz2",),
-        ("gzip",),
-        ("lzma",),
+        ("bz2", "bz2", "BZ2Decompressor", "compresslevel"),
+        ("gzip", "gzip", None, "compresslevel"),
+        ("lzma", "lzma", "LZMADecompressor", "preset"),
         # Third-party compression modules.
-        ("blosc",),
-        ("brotli",),
-        ("lz4", "lz4.frame"),
-        ("snappy",),
-        ("zstd", "zstandard"),
+        ("blosc", "blosc", None, "clevel"),
+        ("brotli", "brotli", None, "quality"),
+        ("lz4", "lz4.frame", "LZ4FrameDecompressor", "compression_level"),
+        ("snappy", "snappy", None, None),
+        ("zstd", "zstandard", None, "level"),
     )
-    for lib in libs:
-        name, module_name = lib if len(lib) == 2 else (lib[0], lib[0])  # pylint: disable=unbalanced-tuple-unpacking
-        try:
-            mod = importlib.import_module(module_name)
-            if name == "zstd":
-                __COMPRESSORS__[name] = Transform(mod.ZstdCompressor().compress, mod.ZstdDecompressor().decompress)
-            else:
-                __COMPRESSORS__[name] = Compressor(mod)
-        except ImportError:
-            pass
+    for name, module_name, stream_decompressor, level_kwarg in libs:
+        # Only check that the module can be found, imports are deferred until the first compression operation.
+        if not _module_available(module_name.partition(".")[0]):
+            continue
+        compress_kwargs = {level_kwarg: levels[name]} if level_kwarg and name in levels else None
+        if name == "zstd":
+            __COMPRESSORS__[name] = ZstdCompressor(compress_kwargs=compress_kwargs)
+        else:
+            __COMPRESSORS__[name] = (_GzipCompressor if name == "gzip" else Compressor)(
+                _LazyModule(module_name),
+                compress_kwargs=compress_kwargs,
+                stream_decompressor=stream_decompressor,
+            )
     return sorted(set(str(key).lower() for key in __COMPRESSORS__))
+
+
+# Discover the default compressors once on import. Discovery only checks that modules can be found, without importing
+# them, so filesystems and files can use the shared cache without a setup check on every creation.
+init_compressors()
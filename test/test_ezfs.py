@@ -1,123 +1,71 @@
 """Unit tests for EZFS utilities."""
 
+import gzip
 import io
+import os
+import pathlib
 import sqlite3
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from types import SimpleNamespace
 from typing import Any
 from typing import Callable
+from typing import Mapping
 
 import pytest
 import zstandard
 
 import ezfs
 
+# Shared read-only default for optional kwargs, to prevent creating a new empty dict for every test case.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 TEST_FILE = "test.txt"
+REMOVE_TEST_FILE = "remove" + TEST_FILE
+RENAME_TEST_FILE = "rename" + TEST_FILE
 TEST_STRING = "Test string content for storage repeated 3 times." * 3
+TEST_STRING_49 = TEST_STRING[:49]
 TEST_STRING_BINARY = TEST_STRING.encode("utf-8")
-SWAP_TRANSFORM_1 = ezfs.Transform(
-    apply=lambda data: data.decode().replace("e", "-").encode(),
-    remove=lambda data: data.decode().replace("-", "e").encode(),
-)
-SWAP_TRANSFORM_2 = ezfs.Transform(
-    apply=lambda data: data.decode().replace("t", "*").encode(),
-    remove=lambda data: data.decode().replace("*", "t").encode(),
-)
+TEST_STRING_BINARY_49 = TEST_STRING_BINARY[:49]
+_SWAP_APPLY_1 = bytes.maketrans(b"e", b"-")
+_SWAP_REMOVE_1 = bytes.maketrans(b"-", b"e")
+_SWAP_APPLY_2 = bytes.maketrans(b"t", b"*")
+_SWAP_REMOVE_2 = bytes.maketrans(b"*", b"t")
+
+
+def _swap_apply_1(data: bytes) -> bytes:
+    """Swap "e" characters with "-" characters."""
+    return data.translate(_SWAP_APPLY_1)
+
+
+def _swap_remove_1(data: bytes) -> bytes:
+    """Swap "-" characters back to "e" characters."""
+    return data.translate(_SWAP_REMOVE_1)
+
+
+def _swap_apply_2(data: bytes) -> bytes:
+    """Swap "t" characters with "*" characters."""
+    return data.translate(_SWAP_APPLY_2)
+
+
+def _swap_remove_2(data: bytes) -> bytes:
+    """Swap "*" characters back to "t" characters."""
+    return data.translate(_SWAP_REMOVE_2)
+
+
+SWAP_TRANSFORM_1 = ezfs.Transform(apply=_swap_apply_1, remove=_swap_remove_1)
+SWAP_TRANSFORM_2 = ezfs.Transform(apply=_swap_apply_2, remove=_swap_remove_2)
+TEST_STRING_SWAP_1 = b"T-st string cont-nt for storag- r-p-at-d 3 tim-s."
+# Expected compressed content is generated, rather than hardcoded, so that it matches the installed zstandard version.
+TEST_STRING_ZSTD = zstandard.ZstdCompressor().compress(TEST_STRING_BINARY)
+TEST_STRING_ZSTD_LEVEL_20 = zstandard.ZstdCompressor(level=20).compress(TEST_STRING_BINARY)
+ZSTD_COMPRESSOR = ezfs.Compressor(zstandard)
+ZSTD_LEVEL_20 = ezfs.Compressor(zstandard, compress_kwargs={"level": 20})
 
 
 TEST_CASES = {
     "filesystem": {
-        "invalid mode": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "u",
-                },
-            },
-            "raises": ValueError,
-        },
-        "read and write mode": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "rw",
-                },
-            },
-            "raises": ValueError,
-        },
-        "text and binary mode": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "tb",
-                },
-            },
-            "raises": ValueError,
-        },
-        "not found": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE + "abc",
-                },
-            },
-            "raises": FileNotFoundError,
-        },
-        "not writeable": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                },
-                "content": TEST_STRING,
-            },
-            "raises": io.UnsupportedOperation,
-        },
-        "not readable": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "wb",
-                },
-            },
-            "raises": io.UnsupportedOperation,
-        },
-        "not bytes": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "wb",
-                },
-                "content": TEST_STRING,
-            },
-            "raises": TypeError,
-        },
-        "not str": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "wt",
-                },
-                "content": TEST_STRING_BINARY,
-            },
-            "raises": TypeError,
-        },
-        "not bytes or string": {
-            "kwargs": {
-                "filesystem_cls": ezfs.MemFilesystem,
-                "file_kwargs": {
-                    "file": TEST_FILE,
-                    "mode": "wt",
-                },
-                "content": ("test", b"test"),
-            },
-            "raises": TypeError,
-        },
         "no compression or transform": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
@@ -125,6 +73,7 @@ TEST_CASES = {
                     "file": TEST_FILE,
                     "mode": "w",
                 },
+                "read_text": True,
                 "content": TEST_STRING,
             },
             "returns": {
@@ -147,10 +96,9 @@ TEST_CASES = {
                 "content": TEST_STRING,
             },
             "returns": {
-                "wrote": 66,
-                "raw": b"(\xb5/\xfd \x93\xcd\x01\x00\x14\x03Test string content for storage repeated 3 times.\x01\x00\xf1tRP",
+                "wrote": len(TEST_STRING_ZSTD),
+                "raw": TEST_STRING_ZSTD,
                 "read_bytes": TEST_STRING_BINARY,
-                "read_text": TEST_STRING,
             },
         },
         "compression at file level": {
@@ -164,10 +112,9 @@ TEST_CASES = {
                 "content": TEST_STRING,
             },
             "returns": {
-                "wrote": 66,
-                "raw": b"(\xb5/\xfd \x93\xcd\x01\x00\x14\x03Test string content for storage repeated 3 times.\x01\x00\xf1tRP",
+                "wrote": len(TEST_STRING_ZSTD),
+                "raw": TEST_STRING_ZSTD,
                 "read_bytes": TEST_STRING_BINARY,
-                "read_text": TEST_STRING,
             },
         },
         "transform at filesystem level": {
@@ -180,13 +127,12 @@ TEST_CASES = {
                     "file": TEST_FILE,
                     "mode": "w",
                 },
-                "content": TEST_STRING[:49],
+                "content": TEST_STRING_49,
             },
             "returns": {
                 "wrote": 49,
-                "raw": b"T-st string cont-nt for storag- r-p-at-d 3 tim-s.",
-                "read_bytes": TEST_STRING_BINARY[:49],
-                "read_text": TEST_STRING[:49],
+                "raw": TEST_STRING_SWAP_1,
+                "read_bytes": TEST_STRING_BINARY_49,
             },
         },
         "transform at file level": {
@@ -197,13 +143,12 @@ TEST_CASES = {
                     "mode": "w",
                     "transform": SWAP_TRANSFORM_1,
                 },
-                "content": TEST_STRING[:49],
+                "content": TEST_STRING_49,
             },
             "returns": {
                 "wrote": 49,
-                "raw": b"T-st string cont-nt for storag- r-p-at-d 3 tim-s.",
-                "read_bytes": TEST_STRING_BINARY[:49],
-                "read_text": TEST_STRING[:49],
+                "raw": TEST_STRING_SWAP_1,
+                "read_bytes": TEST_STRING_BINARY_49,
             },
         },
         "chained transform": {
@@ -214,13 +159,12 @@ TEST_CASES = {
                     "mode": "w",
                     "transform": ezfs.Transform.chain(SWAP_TRANSFORM_1, SWAP_TRANSFORM_2),
                 },
-                "content": TEST_STRING[:49],
+                "content": TEST_STRING_49,
             },
             "returns": {
                 "wrote": 49,
                 "raw": b"T-s* s*ring con*-n* for s*orag- r-p-a*-d 3 *im-s.",
-                "read_bytes": TEST_STRING_BINARY[:49],
-                "read_text": TEST_STRING[:49],
+                "read_bytes": TEST_STRING_BINARY_49,
             },
         },
         "local str": {
@@ -233,6 +177,7 @@ TEST_CASES = {
                     "file": TEST_FILE,
                     "mode": "w",
                 },
+                "read_text": True,
                 "content": TEST_STRING,
             },
             "returns": {
@@ -258,7 +203,6 @@ TEST_CASES = {
                 "wrote": 147,
                 "raw": TEST_STRING_BINARY,
                 "read_bytes": TEST_STRING_BINARY,
-                "read_text": TEST_STRING,
             },
         },
         "local text with compression and coercion to bytes": {
@@ -272,28 +216,16 @@ TEST_CASES = {
                     "mode": "wt",
                     "compression": "zstd",
                 },
+                "read_text": True,
                 "content": TEST_STRING,
             },
             "returns": {
-                "wrote": 66,
-                "raw": b"(\xb5/\xfd \x93\xcd\x01\x00\x14\x03Test string content for storage repeated 3 times.\x01\x00\xf1tRP",
+                "wrote": len(TEST_STRING_ZSTD),
+                "raw": TEST_STRING_ZSTD,
                 "read_bytes": TEST_STRING_BINARY,
                 "read_text": TEST_STRING,
             },
         },
-        "local unsafe path": {
-            "kwargs": {
-                "filesystem_cls": ezfs.LocalFilesystem,
-                "filesystem_kwargs": {
-                    "directory": "replaced_by_test_with_tmpdir",
-                },
-                "file_kwargs": {
-                    "file": "../" + TEST_FILE,
-                    "mode": "w",
-                },
-            },
-            "raises": FileNotFoundError,
-        },
         "sqlite": {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
@@ -301,6 +233,7 @@ TEST_CASES = {
                     "file": TEST_FILE,
                     "mode": "w",
                 },
+                "read_text": True,
                 "content": TEST_STRING,
             },
             "returns": {
@@ -323,41 +256,67 @@ TEST_CASES = {
                 "wrote": 147,
                 "raw": TEST_STRING_BINARY,
                 "read_bytes": TEST_STRING_BINARY,
-                "read_text": TEST_STRING,
             },
         },
-        "sqlite invalid table": {
+        "sqlite quoted table": {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
                 "filesystem_kwargs": {
-                    "table_name": "inv@lid",
+                    "table_name": 'inv@lid "table"',
                 },
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "w",
+                },
+                "content": TEST_STRING,
+            },
+            "returns": {
+                "wrote": 147,
+                "raw": TEST_STRING_BINARY,
+                "read_bytes": TEST_STRING_BINARY,
             },
-            "raises": ValueError,
         },
-        "sqlite invalid file col": {
+        "sqlite quoted file col": {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
                 "filesystem_kwargs": {
-                    "file_col": "inv@lid",
+                    "file_col": 'inv@lid "file col"',
                 },
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "w",
+                },
+                "content": TEST_STRING,
+            },
+            "returns": {
+                "wrote": 147,
+                "raw": TEST_STRING_BINARY,
+                "read_bytes": TEST_STRING_BINARY,
             },
-            "raises": ValueError,
         },
-        "sqlite invalid content col": {
+        "sqlite quoted content col": {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
                 "filesystem_kwargs": {
-                    "content_col": "inv@lid",
+                    "content_col": 'inv@lid "content col"',
                 },
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "w",
+                },
+                "content": TEST_STRING,
+            },
+            "returns": {
+                "wrote": 147,
+                "raw": TEST_STRING_BINARY,
+                "read_bytes": TEST_STRING_BINARY,
             },
-            "raises": ValueError,
         },
         "custom compressor with compression kwargs": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
                 "filesystem_kwargs": {
-                    "compression": ezfs.Compressor(zstandard, compress_kwargs={"level": 20}),
+                    "compression": ZSTD_LEVEL_20,
                 },
                 "file_kwargs": {
                     "file": TEST_FILE,
@@ -366,19 +325,125 @@ TEST_CASES = {
                 "content": TEST_STRING,
             },
             "returns": {
-                "wrote": 57,
-                "raw": b"(\xb5/\xfd \x93\x85\x01\x00\x12\xc3\t\x0e\xc0\xeb\xc2\x89\xd8\x8al6\xbf\x7f\xaa\xdauO \x8d\xce\x1bJ\xfcr2\xd6\xa6\xf0\x9e\xc5+\xbd\xf9v\xa3\xc6\x0e>\xfb\xb4\x08\x01\x00\xf1tRP",
+                "wrote": len(TEST_STRING_ZSTD_LEVEL_20),
+                "raw": TEST_STRING_ZSTD_LEVEL_20,
                 "read_bytes": TEST_STRING_BINARY,
-                "read_text": TEST_STRING,
             },
         },
     },
+    "filesystem raises": {
+        "invalid mode": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "u",
+                },
+            },
+            "raises": ValueError,
+        },
+        "read and write mode": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "rw",
+                },
+            },
+            "raises": ValueError,
+        },
+        "text and binary mode": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "tb",
+                },
+            },
+            "raises": ValueError,
+        },
+        "not found": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE + "abc",
+                },
+            },
+            "raises": FileNotFoundError,
+        },
+        "not writeable": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                },
+                "content": TEST_STRING,
+            },
+            "raises": io.UnsupportedOperation,
+        },
+        "not readable": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "wb",
+                },
+            },
+            "raises": io.UnsupportedOperation,
+        },
+        "not bytes": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "wb",
+                },
+                "content": TEST_STRING,
+            },
+            "raises": TypeError,
+        },
+        "not str": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "wt",
+                },
+                "content": TEST_STRING_BINARY,
+            },
+            "raises": TypeError,
+        },
+        "not bytes or string": {
+            "kwargs": {
+                "filesystem_cls": ezfs.MemFilesystem,
+                "file_kwargs": {
+                    "file": TEST_FILE,
+                    "mode": "wt",
+                },
+                "content": ("test", b"test"),
+            },
+            "raises": TypeError,
+        },
+        "local unsafe path": {
+            "kwargs": {
+                "filesystem_cls": ezfs.LocalFilesystem,
+                "filesystem_kwargs": {
+                    "directory": "replaced_by_test_with_tmpdir",
+                },
+                "file_kwargs": {
+                    "file": "../" + TEST_FILE,
+                    "mode": "w",
+                },
+            },
+            "raises": FileNotFoundError,
+        },
+    },
     "filesystem remove": {
         "memory": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE,
+                    "file": REMOVE_TEST_FILE,
                 },
             },
             "returns": True,
@@ -387,7 +452,7 @@ TEST_CASES = {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE + "abc",
+                    "file": REMOVE_TEST_FILE + "abc",
                 },
                 "skip_write": True,
             },
@@ -400,7 +465,7 @@ TEST_CASES = {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE,
+                    "file": REMOVE_TEST_FILE,
                 },
             },
             "returns": True,
@@ -412,7 +477,7 @@ TEST_CASES = {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE + "abc",
+                    "file": REMOVE_TEST_FILE + "abc",
                 },
                 "skip_write": True,
             },
@@ -425,7 +490,7 @@ TEST_CASES = {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
                 "file_kwargs": {
-                    "file": "../remove" + TEST_FILE,
+                    "file": "../" + REMOVE_TEST_FILE,
                 },
                 "skip_write": True,
             },
@@ -439,7 +504,7 @@ TEST_CASES = {
                     "safe_paths": False,
                 },
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE,
+                    "file": REMOVE_TEST_FILE,
                 },
                 "remove_kwargs": {
                     "name": "test",
@@ -451,7 +516,7 @@ TEST_CASES = {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE,
+                    "file": REMOVE_TEST_FILE,
                 },
             },
             "returns": True,
@@ -460,7 +525,7 @@ TEST_CASES = {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE + "abc",
+                    "file": REMOVE_TEST_FILE + "abc",
                 },
             },
             "returns": True,
@@ -469,7 +534,7 @@ TEST_CASES = {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
                 "file_kwargs": {
-                    "file": "remove" + TEST_FILE,
+                    "file": REMOVE_TEST_FILE,
                 },
                 "remove_kwargs": {
                     "dir_fd": 1,
@@ -482,16 +547,16 @@ TEST_CASES = {
         "memory": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
             },
             "returns": True,
         },
         "memory, not found": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "skip_write": True,
             },
             "raises": FileNotFoundError,
@@ -499,8 +564,8 @@ TEST_CASES = {
         "local": {
             "kwargs": {
                 "filesystem_cls": ezfs.LocalFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "filesystem_kwargs": {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
@@ -510,8 +575,8 @@ TEST_CASES = {
         "local, not found": {
             "kwargs": {
                 "filesystem_cls": ezfs.LocalFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "filesystem_kwargs": {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
@@ -522,8 +587,8 @@ TEST_CASES = {
         "local, unsafe src": {
             "kwargs": {
                 "filesystem_cls": ezfs.LocalFilesystem,
-                "src": "../rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": "../" + RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "filesystem_kwargs": {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
@@ -534,8 +599,8 @@ TEST_CASES = {
         "local, unsafe dst": {
             "kwargs": {
                 "filesystem_cls": ezfs.LocalFilesystem,
-                "src": "../rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": "../" + RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "filesystem_kwargs": {
                     "directory": "replaced_by_test_with_tmpdir",
                 },
@@ -546,24 +611,24 @@ TEST_CASES = {
         "sqlite": {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
             },
             "returns": True,
         },
         "sqlite not found": {
             "kwargs": {
                 "filesystem_cls": ezfs.SQLiteFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
             },
             "returns": True,
         },
         "unsupported src_dir_fd": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "rename_kwargs": {
                     "src_dir_fd": 1,
                 },
@@ -573,8 +638,8 @@ TEST_CASES = {
         "unsupported dst_dir_fd": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE + ".moved",
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE + ".moved",
                 "rename_kwargs": {
                     "dst_dir_fd": 1,
                 },
@@ -584,8 +649,8 @@ TEST_CASES = {
         "already exists": {
             "kwargs": {
                 "filesystem_cls": ezfs.MemFilesystem,
-                "src": "rename" + TEST_FILE,
-                "dst": "rename" + TEST_FILE,
+                "src": RENAME_TEST_FILE,
+                "dst": RENAME_TEST_FILE,
             },
             "raises": FileExistsError,
         },
@@ -637,93 +702,138 @@ TEST_CASES = {
 }
 
 
-def _tmpdir_wrapper(
+def _xdist_groups(test_cases: dict) -> dict:
+    """Group test cases by filesystem type, so that each xdist worker reuses the fewest cached filesystems."""
+    return {
+        name: pytest.param(test_case, marks=pytest.mark.xdist_group(test_case["kwargs"]["filesystem_cls"].__name__))
+        for name, test_case in test_cases.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def fs_cache(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Create a cache of filesystems to reuse across test cases, with a shared directory for local filesystems."""
+    return {"directory": str(tmp_path_factory.mktemp("ezfs"))}
+
+
+def _reset_filesystem(filesystem: ezfs.Filesystem) -> None:
+    """Remove all files from a cached filesystem so that it can be reused by another test case."""
+    if isinstance(filesystem, ezfs.MemFilesystem):
+        filesystem.tree.clear()
+    elif isinstance(filesystem, ezfs.SQLiteFilesystem):
+        filesystem.execute(f"DELETE FROM {ezfs._quote_identifier(filesystem.table_name)}")  # nosec
+    elif isinstance(filesystem, ezfs.LocalFilesystem):
+        for entry in os.scandir(filesystem.directory):
+            os.unlink(entry.path)
+
+
+def _filesystem_wrapper(
     func: Callable,
+    fs_cache: dict,
     filesystem_cls: type[ezfs.Filesystem],
     *args: Any,
-    filesystem_kwargs: dict | None = None,
+    filesystem_kwargs: Mapping[str, Any] = _EMPTY,
     **kwargs: Any,
-) -> bool:
-    """Wrap a function call in a temporary directory that will clean up automatically if a local filesystem test."""
+) -> Any:
+    """Wrap a function call with a cached filesystem that will be cleaned up automatically after the test case."""
     if filesystem_cls == ezfs.LocalFilesystem:
-        with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
-            filesystem_kwargs["directory"] = tmpdir
-            return func(filesystem_cls, *args, filesystem_kwargs=filesystem_kwargs, **kwargs)
-    else:
-        return func(filesystem_cls, *args, filesystem_kwargs=filesystem_kwargs, **kwargs)
+        filesystem_kwargs = {**filesystem_kwargs, "directory": fs_cache["directory"]}
+    key = (filesystem_cls, tuple(sorted(filesystem_kwargs.items())))
+    filesystem = fs_cache.get(key)
+    if filesystem is None:
+        filesystem = fs_cache[key] = filesystem_cls(**filesystem_kwargs)
+    try:
+        return func(filesystem, *args, **kwargs)
+    finally:
+        _reset_filesystem(filesystem)
 
 
-@pytest.mark.parametrize_test_case("test_case", TEST_CASES["file properties"])
-def test_file_properties(test_case: dict, function_tester: Callable) -> None:
+@pytest.mark.parametrize_test_case("test_case", _xdist_groups(TEST_CASES["file properties"]))
+def test_file_properties(test_case: dict, function_tester: Callable, fs_cache: dict) -> None:
     """Test file object basic properties."""
 
     def _wrapper(
-        filesystem_cls: type[ezfs.Filesystem],
-        filesystem_kwargs: dict | None = None,
-        file_kwargs: dict | None = None,
+        filesystem: ezfs.Filesystem,
+        file_kwargs: dict,
     ) -> dict:
         result = {}
-        filesystem = filesystem_cls(**(filesystem_kwargs or {}))
-        with filesystem.open(**(file_kwargs or {})) as file:
+        with filesystem.open(**file_kwargs) as file:
             result["str"] = str(file)
             result["repr"] = repr(file)
-            if filesystem_cls == ezfs.LocalFilesystem:
+            if isinstance(filesystem, ezfs.LocalFilesystem):
                 result["repr"] = result["repr"].replace(filesystem.directory, "PYTEST_TMP_DIR")
         return result
 
-    function_tester(test_case, lambda *args, **kwargs: _tmpdir_wrapper(_wrapper, *args, **kwargs))
+    function_tester(test_case, lambda *args, **kwargs: _filesystem_wrapper(_wrapper, fs_cache, *args, **kwargs))
 
 
-@pytest.mark.parametrize_test_case("test_case", TEST_CASES["filesystem"])
-def test_filesystem(test_case: dict, function_tester: Callable) -> None:
+@pytest.mark.parametrize_test_case("test_case", _xdist_groups(TEST_CASES["filesystem"]))
+def test_filesystem(test_case: dict, function_tester: Callable, fs_cache: dict) -> None:
     """Create a filesystem, and test common file read/write combinations."""
 
     def _wrapper(
-        filesystem_cls: type[ezfs.Filesystem],
-        filesystem_kwargs: dict | None = None,
-        file_kwargs: dict | None = None,
+        filesystem: ezfs.Filesystem,
+        file_kwargs: dict,
         content: bytes | str = "",
+        read_text: bool = False,
     ) -> dict:
         result = {}
-        filesystem = filesystem_cls(**(filesystem_kwargs or {}))
-        name = file_kwargs.get("file")
-        compression = file_kwargs.get("compression")
-        transform = file_kwargs.get("transform")
-        with filesystem.open(**(file_kwargs or {})) as file:
+        name, compression, transform = file_kwargs["file"], file_kwargs.get("compression"), file_kwargs.get("transform")
+        with filesystem.open(**file_kwargs) as file:
             if content:
                 result["wrote"] = file.write(content)
             else:
                 file.read()
+        buffer = bytearray(256)
         with filesystem.open(name, "rb", compression=ezfs.NO_COMPRESSION, transform=ezfs.NO_TRANSFORM) as file:
-            result["raw"] = file.read()
+            size = file.readinto(buffer)
+        assert size < len(buffer), "Raw content must fit in the buffer to be read fully"
+        result["raw"] = bytes(memoryview(buffer)[:size])
         with filesystem.open(name, "rb", compression=compression, transform=transform) as file:
             result["read_bytes"] = file.read()
-        with filesystem.open(name, "rt", compression=compression, transform=transform) as file:
-            result["read_text"] = file.read()
+        if read_text:
+            with filesystem.open(name, "rt", compression=compression, transform=transform) as file:
+                result["read_text"] = file.read()
         return result
 
-    function_tester(test_case, lambda *args, **kwargs: _tmpdir_wrapper(_wrapper, *args, **kwargs))
+    function_tester(test_case, lambda *args, **kwargs: _filesystem_wrapper(_wrapper, fs_cache, *args, **kwargs))
+
+
+@pytest.mark.parametrize_test_case("test_case", _xdist_groups(TEST_CASES["filesystem raises"]))
+def test_filesystem_raises(test_case: dict, function_tester: Callable, fs_cache: dict) -> None:
+    """Create a filesystem, and test invalid file read/write combinations."""
+
+    def _wrapper(
+        filesystem: ezfs.Filesystem,
+        file_kwargs: dict,
+        content: Any = None,
+    ) -> None:
+        with filesystem.open(**file_kwargs) as file:
+            if content is None:
+                file.read()
+            else:
+                file.write(content)
+
+    function_tester(test_case, lambda *args, **kwargs: _filesystem_wrapper(_wrapper, fs_cache, *args, **kwargs))
 
 
-@pytest.mark.parametrize_test_case("test_case", TEST_CASES["filesystem remove"])
-def test_filesystem_remove(test_case: dict, function_tester: Callable) -> None:
+@pytest.mark.parametrize_test_case("test_case", _xdist_groups(TEST_CASES["filesystem remove"]))
+def test_filesystem_remove(test_case: dict, function_tester: Callable, fs_cache: dict) -> None:
     """Test filesystem remove operations."""
 
     def _wrapper(
-        filesystem_cls: type[ezfs.Filesystem],
-        filesystem_kwargs: dict | None = None,
-        file_kwargs: dict | None = None,
-        remove_kwargs: dict | None = None,
+        filesystem: ezfs.Filesystem,
+        file_kwargs: dict,
+        remove_kwargs: Mapping[str, Any] = _EMPTY,
         skip_write: bool = False,
     ) -> bool:
-        filesystem = filesystem_cls(**(filesystem_kwargs or {}))
-        name = file_kwargs.get("file")
+        name = file_kwargs["file"]
         if not skip_write:
-            with filesystem.open(name, "wt") as file:
-                file.write("test")
-        remove_kwargs = remove_kwargs or {}
-        name = remove_kwargs.pop("name") if "name" in remove_kwargs else name
-        filesystem.remove(name, **(remove_kwargs or {}))
+            filesystem.write_bytes(name, b"test")
+        if "name" in remove_kwargs:
+            remove_kwargs = dict(remove_kwargs)
+            name = remove_kwargs.pop("name")
+        filesystem.remove(name, **remove_kwargs)
         try:
             with filesystem.open(name) as file:
                 file.read()
@@ -731,26 +841,23 @@ def test_filesystem_remove(test_case: dict, function_tester: Callable) -> None:
             return True
         return False
 
-    function_tester(test_case, lambda *args, **kwargs: _tmpdir_wrapper(_wrapper, *args, **kwargs))
+    function_tester(test_case, lambda *args, **kwargs: _filesystem_wrapper(_wrapper, fs_cache, *args, **kwargs))
 
 
-@pytest.mark.parametrize_test_case("test_case", TEST_CASES["filesystem rename"])
-def test_filesystem_rename(test_case: dict, function_tester: Callable) -> None:
+@pytest.mark.parametrize_test_case("test_case", _xdist_groups(TEST_CASES["filesystem rename"]))
+def test_filesystem_rename(test_case: dict, function_tester: Callable, fs_cache: dict) -> None:
     """Test filesystem rename operations."""
 
     def _wrapper(
-        filesystem_cls: type[ezfs.Filesystem],
+        filesystem: ezfs.Filesystem,
         src: str,
         dst: str,
-        filesystem_kwargs: dict | None = None,
-        rename_kwargs: dict | None = None,
+        rename_kwargs: Mapping[str, Any] = _EMPTY,
         skip_write: bool = False,
     ) -> bool:
-        filesystem = filesystem_cls(**(filesystem_kwargs or {}))
         if not skip_write:
-            with filesystem.open(src, "wt") as file:
-                file.write("test")
-        filesystem.rename(src, dst, **(rename_kwargs or {}))
+            filesystem.write_bytes(src, b"test")
+        filesystem.rename(src, dst, **rename_kwargs)
         try:
             with filesystem.open(src) as file:
                 file.read()
@@ -760,12 +867,27 @@ def test_filesystem_rename(test_case: dict, function_tester: Callable) -> None:
             assert file.read() == "test"
         return True
 
-    function_tester(test_case, lambda *args, **kwargs: _tmpdir_wrapper(_wrapper, *args, **kwargs))
+    function_tester(test_case, lambda *args, **kwargs: _filesystem_wrapper(_wrapper, fs_cache, *args, **kwargs))
+
+
+def test_custom_valid_modes() -> None:
+    """Test file subclasses can define valid modes with unhashable collections."""
+
+    class ReadOnlyFile(ezfs.MemFile):
+        valid_modes = ["r", "b", "t"]
+
+    filesystem = ezfs.MemFilesystem()
+    filesystem.write_bytes(TEST_FILE, TEST_STRING_BINARY)
+    with ReadOnlyFile(filesystem, TEST_FILE, mode="rb") as file_in:
+        assert TEST_STRING_BINARY == file_in.read()
+    with pytest.raises(ValueError), ReadOnlyFile(filesystem, TEST_FILE, mode="w"):
+        pass
 
 
 def test_sqlite_row_factory() -> None:
     """Test sqlite connection override to change row factory."""
     filesystem = ezfs.SQLiteFilesystem()
+    assert "WITHOUT ROWID" in filesystem.execute("SELECT sql FROM sqlite_master").fetchone()[0]
     with filesystem.open("test", "w") as file_out:
         file_out.write("test content")
     assert ("test", b"test content") == filesystem.execute("SELECT * FROM files").fetchone()
@@ -776,7 +898,6 @@ def test_sqlite_row_factory() -> None:
         def _connect(self) -> None:
             self._connection = sqlite3.connect(self.database)
             self._connection.row_factory = sqlite3.Row
-            self._cursor = self._connection.cursor()
 
     filesystem = DictRows()
     with filesystem.open("test", "w") as file_out:
@@ -786,8 +907,470 @@ def test_sqlite_row_factory() -> None:
 
 def test_transform_chain_with_compressor() -> None:
     """Test that a compressor can be mixed with plain transforms."""
-    ezfs.Transform.chain(
+    transform = ezfs.Transform.chain(
         SWAP_TRANSFORM_1,
         SWAP_TRANSFORM_2,
-        ezfs.Compressor(zstandard),
+        ZSTD_COMPRESSOR,
     )
+    assert TEST_STRING_BINARY == transform.remove(transform.apply(TEST_STRING_BINARY))
+
+
+def test_sqlite_read_pool() -> None:
+    """Test sqlite reads are shared across threads with a pool of read-only connections, including during batches."""
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        filesystem = ezfs.SQLiteFilesystem(os.path.join(tmpdir, "test.db"), read_pool_size=2)
+        filesystem.create_table()
+        with filesystem.open("test", "w") as file_out:
+            file_out.write("test content")
+
+        def _read(name: str) -> str:
+            with filesystem.open(name) as file_in:
+                return file_in.read()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert ["test content"] * 8 == list(executor.map(_read, ["test"] * 8))
+        assert filesystem.isfile("test")
+        assert not filesystem.isfile("missing")
+
+        # A batch in one thread must not move reads from other threads to the primary connection.
+        with filesystem.batch(), ThreadPoolExecutor(max_workers=2) as executor:
+            filesystem.write_bytes("pending", b"test content")
+            assert filesystem.isfile("pending")
+            assert [True, False] == list(executor.map(filesystem.isfile, ["test", "pending"]))
+        assert filesystem.isfile("pending")
+
+
+def test_sqlite_journal_mode() -> None:
+    """Test sqlite file databases keep the existing journal mode by default, and can opt in to write-ahead logging."""
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        database = os.path.join(tmpdir, "test.db")
+        filesystem = ezfs.SQLiteFilesystem(database)
+        assert "delete" == filesystem.execute("PRAGMA journal_mode").fetchone()[0]
+        filesystem = ezfs.SQLiteFilesystem(database, journal_mode="WAL")
+        assert "wal" == filesystem.execute("PRAGMA journal_mode").fetchone()[0]
+        assert 32768 == filesystem.execute("PRAGMA page_size").fetchone()[0]
+        assert 1 == filesystem.execute("PRAGMA synchronous").fetchone()[0]
+        filesystem.create_table()
+        with filesystem.open("test", "w") as file_out:
+            file_out.write("test content")
+        with ezfs.SQLiteFilesystem(database).open("test") as file_in:
+            assert "test content" == file_in.read()
+        filesystem = ezfs.SQLiteFilesystem(os.path.join(tmpdir, "test2.db"), journal_mode="TRUNCATE")
+        assert "truncate" == filesystem.execute("PRAGMA journal_mode").fetchone()[0]
+        # Rollback journal modes keep full syncs, they are not safe from corruption with fewer syncs.
+        assert 2 == filesystem.execute("PRAGMA synchronous").fetchone()[0]
+        with pytest.raises(ValueError):
+            ezfs.SQLiteFilesystem(database, journal_mode="WAL; DROP TABLE files")
+
+
+def test_sqlite_overwrite() -> None:
+    """Test sqlite writes replace the content of existing files."""
+    filesystem = ezfs.SQLiteFilesystem()
+    for content in (b"first content", b"second"):
+        with filesystem.open("test", "wb") as file_out:
+            file_out.write(content)
+    assert [("test", b"second")] == filesystem.execute("SELECT * FROM files").fetchall()
+
+
+def test_zstd_dictionary() -> None:
+    """Test zstd compression with a trained dictionary improves small file compression, and reverses cleanly."""
+    samples = [f'{{"id": {i}, "name": "user{i}", "email": "user{i}@example.com"}}'.encode() for i in range(500)]
+    dict_data = ezfs.ZstdCompressor.train(samples, dict_size=1024)
+    filesystem = ezfs.MemFilesystem(compression=ezfs.ZstdCompressor(dict_data))
+    with filesystem.open("test", "wb") as file_out:
+        file_out.write(samples[7])
+    with filesystem.open("test", "rb") as file_in:
+        assert samples[7] == file_in.read()
+    assert len(filesystem.tree["test"]) < len(ezfs.ZstdCompressor().apply(samples[7]))
+
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        dict_path = os.path.join(tmpdir, "test.dict")
+        with open(dict_path, "wb") as file_out:
+            file_out.write(dict_data)
+        assert samples[7] == ezfs.ZstdCompressor(dict_path).remove(filesystem.tree["test"])
+
+
+def test_zstd_threads() -> None:
+    """Test zstd compression contexts are not shared across threads."""
+    compressor = ezfs.ZstdCompressor()
+    contents = [TEST_STRING_BINARY * index for index in range(1, 33)]
+
+    def _round_trip(content: bytes) -> bytes:
+        return compressor.remove(compressor.apply(content))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert contents == list(executor.map(_round_trip, contents))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="sqlite3 blobopen requires Python 3.11+")
+def test_sqlite_blobopen() -> None:
+    """Test sqlite raw content can be streamed incrementally, and tables without rowids raise a clear error."""
+    filesystem = ezfs.SQLiteFilesystem(compression="zstd", without_rowid=False)
+    with filesystem.open("test", "wb") as file_out:
+        file_out.write(TEST_STRING_BINARY)
+    with filesystem.blobopen("test") as blob:
+        reader = zstandard.ZstdDecompressor().stream_reader(blob)
+        assert TEST_STRING_BINARY == reader.read(len(TEST_STRING_BINARY))
+    with pytest.raises(FileNotFoundError):
+        filesystem.blobopen("missing")
+    filesystem = ezfs.SQLiteFilesystem()
+    filesystem.write_bytes("test", TEST_STRING_BINARY)
+    with pytest.raises(NotImplementedError):
+        filesystem.blobopen("test")
+
+
+def test_sqlite_write_many() -> None:
+    """Test sqlite writes multiple files in chunks, with compression applied to each file."""
+    filesystem = ezfs.SQLiteFilesystem(compression="zstd")
+    files = [(f"test{index}", f"{TEST_STRING}{index}".encode()) for index in range(250)]
+    files.append(("test0", TEST_STRING_BINARY))
+    assert sum(len(zstandard.compress(content)) for _, content in files) == filesystem.write_many(files)
+    assert [(250,)] == filesystem.execute("SELECT COUNT(*) FROM files").fetchall()
+    for compression in (ezfs.NO_COMPRESSION, "zstd"):
+        with pytest.raises(TypeError):
+            ezfs.SQLiteFilesystem(compression=compression).write_many([("test", TEST_STRING)])
+    for name, content in (("test0", TEST_STRING_BINARY), ("test249", f"{TEST_STRING}249".encode())):
+        with filesystem.open(name, "rb") as file_in:
+            assert content == file_in.read()
+
+
+def test_sqlite_read_many() -> None:
+    """Test sqlite reads multiple files in chunks, with compression removed from each file."""
+    filesystem = ezfs.SQLiteFilesystem(compression="zstd")
+    files = {f"test{index}": f"{TEST_STRING}{index}".encode() for index in range(25)}
+    filesystem.write_many(files.items())
+    assert files == filesystem.read_many(files, chunk_size=10)
+    assert {"test3": files["test3"]} == filesystem.read_many(["test3", "test3"])
+    assert ["test9", "test1", "test5"] == list(filesystem.read_many(["test9", "test1", "test5"], chunk_size=2))
+    with pytest.raises(FileNotFoundError):
+        filesystem.read_many(["test0", "missing"])
+
+
+@pytest.mark.parametrize("compression", [ezfs.NO_COMPRESSION, "zstd"])
+def test_mem_write_many(compression: str) -> None:
+    """Test in-memory filesystem writes multiple files at once, with compression applied to each file."""
+    filesystem = ezfs.MemFilesystem(compression=compression)
+    files = [(f"test{index}", f"{TEST_STRING}{index}".encode()) for index in range(10)]
+    written = filesystem.write_many(iter(files))
+    assert sum(len(filesystem.tree[name]) for name, _ in files) == written
+    assert 10 == len(filesystem.tree)
+    for name, content in files:
+        with filesystem.open(name, "rb") as file_in:
+            assert content == file_in.read()
+
+
+@pytest.mark.parametrize("filesystem_cls", [ezfs.MemFilesystem, ezfs.SQLiteFilesystem])
+def test_path_types(filesystem_cls: type[ezfs.Filesystem]) -> None:
+    """Test filesystem operations accept str, bytes, and PathLike paths."""
+    filesystem = filesystem_cls()
+    with filesystem.open("test", "w") as file_out:
+        file_out.write("test content")
+    assert filesystem.isfile(pathlib.PurePath("test"))
+    assert filesystem.isfile(b"test")
+    filesystem.rename(pathlib.PurePath("test"), b"moved")
+    assert not filesystem.isfile("test")
+    filesystem.remove(pathlib.PurePath("moved"))
+    assert not filesystem.isfile("moved")
+
+
+def test_sqlite_batch() -> None:
+    """Test sqlite modifications are committed once per batch, and rolled back on failure, including nested batches."""
+    filesystem = ezfs.SQLiteFilesystem()
+    with filesystem.batch():
+        with filesystem.batch():
+            for name in ("test1", "test2", "test3"):
+                with filesystem.open(name, "w") as file_out:
+                    file_out.write("test content")
+        filesystem.rename("test1", "moved")
+        filesystem.remove("test2")
+        assert filesystem.isfile("moved")
+        assert filesystem._connection.in_transaction
+    assert not filesystem._connection.in_transaction
+    assert [("moved",), ("test3",)] == filesystem.execute("SELECT file FROM files ORDER BY file").fetchall()
+
+    with pytest.raises(RuntimeError):
+        with filesystem.batch():
+            filesystem.remove("moved")
+            raise RuntimeError("abort batch")
+    assert filesystem.isfile("moved")
+
+    # A failed nested batch only rolls back its own modifications, even if the error is handled by the outer batch.
+    with filesystem.batch():
+        filesystem.remove("moved")
+        with pytest.raises(RuntimeError), filesystem.batch():
+            filesystem.remove("test3")
+            raise RuntimeError("abort nested batch")
+        assert filesystem.isfile("test3")
+    assert [("test3",)] == filesystem.execute("SELECT file FROM files ORDER BY file").fetchall()
+
+
+def test_sqlite_apsw_driver(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test sqlite operations with the optional apsw driver, and fallback to the builtin driver."""
+    pytest.importorskip("apsw")
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        filesystem = ezfs.SQLiteFilesystem(
+            os.path.join(tmpdir, "test.db"), read_pool_size=1, driver="apsw", without_rowid=False
+        )
+        filesystem.create_table()
+        assert "apsw" == filesystem.driver
+        with filesystem.batch():
+            filesystem.write_many([("test1", TEST_STRING_BINARY), ("test2", TEST_STRING_BINARY)])
+            filesystem.rename("test1", "moved")
+        filesystem.remove("test2")
+        with filesystem.open("moved", "rb") as file_in:
+            assert TEST_STRING_BINARY == file_in.read()
+        with filesystem.blobopen("moved") as blob:
+            assert TEST_STRING_BINARY == blob.read()
+        assert not filesystem.isfile("test2")
+
+    monkeypatch.setitem(sys.modules, "apsw", None)
+    assert "sqlite3" == ezfs.SQLiteFilesystem(driver="apsw").driver
+
+
+def test_lazy_compressor_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test compressor modules are not imported until first used."""
+    monkeypatch.delitem(sys.modules, "bz2", raising=False)
+    compressor = ezfs.Compressor(ezfs._LazyModule("bz2"))
+    assert "bz2" not in sys.modules
+    assert TEST_STRING_BINARY == compressor.remove(compressor.apply(TEST_STRING_BINARY))
+    assert "bz2" in sys.modules
+    assert "bz2" in ezfs.init_compressors()
+    assert "missing" not in ezfs.init_compressors()
+
+
+def test_compressor_levels() -> None:
+    """Test default compressors can be registered with custom compression levels."""
+    content = TEST_STRING_BINARY * 100
+    try:
+        ezfs.init_compressors(levels={"gzip": 1, "lzma": 0, "zstd": 1, "snappy": 1})
+        assert {"compresslevel": 1} == ezfs.__COMPRESSORS__["gzip"].compression_kwargs
+        assert {"preset": 0} == ezfs.__COMPRESSORS__["lzma"].compression_kwargs
+        assert {} == ezfs.__COMPRESSORS__["bz2"].compression_kwargs
+        for name in ("gzip", "lzma", "zstd"):
+            compressor = ezfs.__COMPRESSORS__[name]
+            assert content == compressor.remove(compressor.apply(content))
+    finally:
+        ezfs.init_compressors()
+    assert {} == ezfs.__COMPRESSORS__["gzip"].compression_kwargs
+
+
+@pytest.mark.parametrize(
+    "compression,transform",
+    [
+        (ezfs.NO_COMPRESSION, None),
+        ("bz2", None),
+        ("gzip", None),
+        ("lzma", None),
+        ("zstd", None),
+        ("zstd", SWAP_TRANSFORM_1),
+    ],
+)
+def test_iter_chunks(compression: str, transform: ezfs.Transform | None) -> None:
+    """Test file contents can be read in chunks, with compression and transforms removed."""
+    content = TEST_STRING * 1000
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        for filesystem in (
+            ezfs.LocalFilesystem(tmpdir, compression=compression, transform=transform),
+            ezfs.MemFilesystem(compression=compression, transform=transform),
+        ):
+            with filesystem.open(TEST_FILE, "w") as file_out:
+                file_out.write(content)
+            with filesystem.open(TEST_FILE, "rb") as file_in:
+                assert content.encode() == b"".join(file_in.iter_chunks(1024))
+            with filesystem.open(TEST_FILE, "rt") as file_in:
+                assert content == "".join(file_in.iter_chunks(1024))
+
+
+@pytest.mark.parametrize("compression", ["bz2", "lz4", "lzma", "zstd"])
+def test_iter_chunks_truncated(compression: str) -> None:
+    """Test incremental decompression and readinto raise on truncated content, instead of returning partial content."""
+    if compression not in ezfs.COMPRESSORS:
+        pytest.skip(f"{compression} is not installed")
+    filesystem = ezfs.MemFilesystem(compression=compression)
+    with filesystem.open(TEST_FILE, "wb") as file_out:
+        file_out.write(TEST_STRING_BINARY * 100)
+    filesystem.tree[TEST_FILE] = filesystem.tree[TEST_FILE][: len(filesystem.tree[TEST_FILE]) // 2]
+    with filesystem.open(TEST_FILE, "rb") as file_in, pytest.raises(EOFError):
+        b"".join(file_in.iter_chunks(64))
+    with filesystem.open(TEST_FILE, "rb") as file_in, pytest.raises(EOFError):
+        file_in.readinto(bytearray(len(TEST_STRING_BINARY) * 100))
+
+
+@pytest.mark.parametrize("compression", ["bz2", "lzma"])
+def test_iter_chunks_multiple_streams(compression: str) -> None:
+    """Test incremental decompression continues across concatenated compressed streams."""
+    compressor = ezfs.COMPRESSORS[compression]
+    filesystem = ezfs.MemFilesystem(compression=compression)
+    filesystem.tree[TEST_FILE] = compressor.apply(TEST_STRING_BINARY) + compressor.apply(TEST_STRING_BINARY_49)
+    content = TEST_STRING_BINARY + TEST_STRING_BINARY_49
+    for size in (4, 1024):
+        with filesystem.open(TEST_FILE, "rb") as file_in:
+            assert content == b"".join(file_in.iter_chunks(size))
+    buffer = bytearray(len(content) + 10)
+    with filesystem.open(TEST_FILE, "rb") as file_in:
+        assert len(content) == file_in.readinto(buffer)
+    assert content == buffer[: len(content)]
+
+
+@pytest.mark.parametrize("compression", [ezfs.NO_COMPRESSION, "gzip", "zstd"])
+def test_readinto(compression: str) -> None:
+    """Test file contents can be read into pre-allocated buffers, with compression removed."""
+    content = TEST_STRING_BINARY * 100
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        for filesystem in (
+            ezfs.LocalFilesystem(tmpdir, compression=compression),
+            ezfs.MemFilesystem(compression=compression),
+            ezfs.SQLiteFilesystem(compression=compression),
+        ):
+            with filesystem.open(TEST_FILE, "wb") as file_out:
+                file_out.write(content)
+            buffer = bytearray(len(content) + 10)
+            with filesystem.open(TEST_FILE, "rb") as file_in:
+                assert len(content) == file_in.readinto(buffer)
+            assert content == buffer[: len(content)]
+            buffer = bytearray(10)
+            with filesystem.open(TEST_FILE, "rb") as file_in:
+                assert 10 == file_in.readinto(memoryview(buffer))
+            assert content[:10] == buffer
+            with filesystem.open(TEST_FILE, "rt") as file_in, pytest.raises(io.UnsupportedOperation):
+                file_in.readinto(buffer)
+
+
+def test_local_raw_reads() -> None:
+    """Test local binary reads from raw file descriptors match native file behavior."""
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        filesystem = ezfs.LocalFilesystem(tmpdir)
+        with filesystem.open(TEST_FILE, "wb") as file_out:
+            file_out.write(TEST_STRING_BINARY)
+        with filesystem.open(TEST_FILE, "rb") as file_in:
+            assert TEST_STRING_BINARY == file_in.read()
+            assert b"" == file_in.read()
+        with filesystem.open(TEST_FILE, "rb") as file_in, open(os.path.join(tmpdir, TEST_FILE), "ab") as file_out:
+            # Content added after opening must still be read, even though it is past the original size.
+            file_out.write(TEST_STRING_BINARY)
+            file_out.flush()
+            assert TEST_STRING_BINARY * 2 == file_in.read()
+        with filesystem.open(TEST_FILE, "rb") as file_in, pytest.raises(io.UnsupportedOperation):
+            file_in.write(TEST_STRING_BINARY)
+        os.mkdir(os.path.join(tmpdir, "folder"))
+        with pytest.raises(IsADirectoryError), filesystem.open("folder", "rb"):
+            pass
+
+
+def test_local_short_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test local binary reads continue until all content is read when the OS returns less than requested."""
+    os_read = os.read
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        filesystem = ezfs.LocalFilesystem(tmpdir)
+        filesystem.write_bytes(TEST_FILE, TEST_STRING_BINARY)
+        monkeypatch.setattr(os, "read", lambda fd, size: os_read(fd, min(size, 10)))
+        assert TEST_STRING_BINARY == filesystem.read_bytes(TEST_FILE)
+        with filesystem.open(TEST_FILE, "rb") as file_in:
+            assert TEST_STRING_BINARY == file_in.read()
+        with filesystem.open(TEST_FILE, "rb") as file_in, open(os.path.join(tmpdir, TEST_FILE), "ab") as file_out:
+            file_out.write(TEST_STRING_BINARY)
+            file_out.flush()
+            assert TEST_STRING_BINARY * 2 == file_in.read()
+        filesystem.write_bytes(TEST_FILE, b"")
+        assert b"" == filesystem.read_bytes(TEST_FILE)
+        filesystem.write_bytes(TEST_FILE, TEST_STRING_BINARY)
+        buffer = bytearray(len(TEST_STRING_BINARY) + 10)
+        native = ezfs.LocalFile._native  # pylint: disable=protected-access
+
+        def _short_native(file: ezfs.LocalFile) -> SimpleNamespace:
+            return SimpleNamespace(readinto=lambda view: native(file).readinto(view[:10]))
+
+        monkeypatch.setattr(ezfs.LocalFile, "_native", _short_native)
+        with filesystem.open(TEST_FILE, "rb") as file_in:
+            assert len(TEST_STRING_BINARY) == file_in.readinto(buffer)
+        assert TEST_STRING_BINARY == buffer[: len(TEST_STRING_BINARY)]
+
+
+@pytest.mark.parametrize("compression", [ezfs.NO_COMPRESSION, "zstd"])
+def test_read_write_bytes(compression: str) -> None:
+    """Test files can be read and written in a single operation, with and without compression."""
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        for filesystem in (
+            ezfs.LocalFilesystem(tmpdir, compression=compression),
+            ezfs.MemFilesystem(compression=compression),
+            ezfs.SQLiteFilesystem(compression=compression),
+        ):
+            assert filesystem.write_bytes(TEST_FILE, TEST_STRING_BINARY) > 0
+            assert TEST_STRING_BINARY == filesystem.read_bytes(TEST_FILE)
+            with filesystem.open(TEST_FILE, "rb") as file_in:
+                assert TEST_STRING_BINARY == file_in.read()
+            with pytest.raises(FileNotFoundError):
+                filesystem.read_bytes("missing")
+    with pytest.raises(TypeError):
+        ezfs.MemFilesystem(compression=compression).write_bytes(TEST_FILE, TEST_STRING)
+
+
+def test_gzip_members() -> None:
+    """Test gzip decompression with sized output handles multiple members, padding, and invalid data."""
+    compressor = ezfs.COMPRESSORS["gzip"]
+    member = gzip.compress(TEST_STRING_BINARY)
+    assert TEST_STRING_BINARY == compressor.remove(member)
+    assert TEST_STRING_BINARY * 2 == compressor.remove(member + member)
+    assert TEST_STRING_BINARY == compressor.remove(member + b"\x00" * 8)
+    with pytest.raises(EOFError):
+        compressor.remove(member[:-3])
+    with pytest.raises(gzip.BadGzipFile):
+        compressor.remove(member + b"invalid data")
+
+
+@pytest.mark.parametrize("compression", [ezfs.NO_COMPRESSION, "gzip"])
+def test_read_write_many(compression: str) -> None:
+    """Test multiple files can be read and written in parallel threads."""
+    files = {f"test{index}": f"{TEST_STRING}{index}".encode() for index in range(20)}
+    with tempfile.TemporaryDirectory(dir=".", prefix="pytest_") as tmpdir:
+        for filesystem in (
+            ezfs.LocalFilesystem(tmpdir, compression=compression),
+            ezfs.MemFilesystem(compression=compression),
+            ezfs.SQLiteFilesystem(compression=compression),
+        ):
+            assert filesystem.write_many(files.items(), max_workers=4) > 0
+            assert files == filesystem.read_many(files, max_workers=4)
+            with pytest.raises(FileNotFoundError):
+                filesystem.read_many(["test0", "missing"])
+
+
+def test_s3_read() -> None:
+    """Test S3 objects are read with a single request if small, or concurrent ranged requests of one version if large."""
+    pytest.importorskip("boto3")
+    from boto3.s3.transfer import TransferConfig  # pylint: disable=import-outside-toplevel
+    from botocore.response import StreamingBody  # pylint: disable=import-outside-toplevel
+    from botocore.stub import Stubber  # pylint: disable=import-outside-toplevel
+
+    filesystem = ezfs.S3BotoFilesystem(
+        "bucket",
+        access_key_id="test",
+        secret_access_key="test",
+        region_name="us-east-1",
+        # Ranges are requested in order with a single thread, to match the order of the stubbed responses.
+        transfer_config=TransferConfig(
+            multipart_threshold=len(TEST_STRING_BINARY), multipart_chunksize=64, max_concurrency=1
+        ),
+    )
+    content = TEST_STRING_BINARY + b"0"
+
+    def _response(data: bytes, size: int) -> dict:
+        return {"Body": StreamingBody(io.BytesIO(data), len(data)), "ContentLength": size, "ETag": '"etag"'}
+
+    with Stubber(filesystem.client) as stubber:
+        params = {"Bucket": "bucket", "Key": TEST_FILE}
+        stubber.add_response("get_object", _response(TEST_STRING_BINARY[:-1], len(TEST_STRING_BINARY) - 1), params)
+        with filesystem.open(TEST_FILE, "rb") as file_in:
+            assert TEST_STRING_BINARY[:-1] == file_in.read()
+
+        stubber.add_response("get_object", _response(content, len(content)), params)
+        for start in range(64, len(content), 64):
+            end = min(start + 64, len(content)) - 1
+            range_params = {**params, "Range": f"bytes={start}-{end}", "IfMatch": '"etag"'}
+            stubber.add_response("get_object", _response(content[start : end + 1], end + 1 - start), range_params)
+        with filesystem.open(TEST_FILE, "rb") as file_in:
+            assert content == file_in.read()
+
+        stubber.add_client_error("get_object", service_error_code="NoSuchKey", http_status_code=404)
+        with pytest.raises(FileNotFoundError), filesystem.open(TEST_FILE, "rb") as file_in:
+            file_in.read()
+        stubber.assert_no_pending_responses()